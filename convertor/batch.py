@@ -0,0 +1,253 @@
+"""
+Пакетное преобразование чисел без графического интерфейса.
+
+Читает числа построчно из файла или стандартного ввода и пишет результаты
+построчно, не загружая вход в память целиком:
+
+    python -m convertor.batch --pin 16 --pout 2 --acc 8 < numbers.txt
+
+С --workers N вход делится на блоки строк, которые преобразуются в пуле
+процессов; результаты пишутся в исходном порядке.
+
+С --single входной файл содержит одно (очень длинное) число, которое
+преобразуется из файла в файл без загрузки в память целиком:
+
+    python -m convertor.batch --single --pin 16 --pout 10 digits.txt -o result.txt
+
+С --cache FILE результаты сохраняются в постоянном кэше sqlite, общем
+для всех процессов и запусков: повторный прогон того же входа почти
+не выполняет преобразований.
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from convers.conver_file import Conver_File
+from convers.conversion_plan import ConversionPlan
+from disk_cache import DiskCache
+
+BUFFER_SIZE = 1 << 20  # Размер буфера ввода-вывода
+CHUNK_LINES = 20000    # Строк в одном блоке для пула процессов
+CACHE_BLOCK = 500      # Строк на один запрос к постоянному кэшу
+
+
+def read_numbers(stream: TextIO) -> Iterator[str]:
+    """Числа из потока по одному на строку (пробелы по краям отбрасываются)"""
+    for line in stream:
+        yield line.strip()
+
+
+def convert_numbers(numbers: Iterable[str], plan: ConversionPlan,
+                    on_error: Optional[Callable[[int, str], None]] = None,
+                    cache: Optional[DiskCache] = None) -> Iterator[str]:
+    """
+    Преобразование потока чисел по плану. Пустая строка остается пустой;
+    при ошибке, как и в Control_, возвращается исходное число, а номер
+    строки и сообщение передаются в on_error. Если задан cache, результаты
+    берутся из постоянного кэша и сохраняются в него
+    """
+    if cache is not None:
+        yield from convert_numbers_cached(numbers, plan, cache, on_error)
+        return
+
+    for line_no, number in enumerate(numbers, 1):
+        if not number:
+            yield number
+            continue
+        try:
+            yield plan.convert(number)
+        except ValueError as e:
+            if on_error is not None:
+                on_error(line_no, str(e))
+            yield number
+
+
+def convert_numbers_cached(numbers: Iterable[str], plan: ConversionPlan, cache: DiskCache,
+                           on_error: Optional[Callable[[int, str], None]] = None) -> Iterator[str]:
+    """
+    Как convert_numbers, но через постоянный кэш: числа читаются блоками
+    по CACHE_BLOCK, и блок ищется в кэше одним запросом
+    """
+    numbers = iter(numbers)
+    line_no = 0
+    while True:
+        block = list(islice(numbers, CACHE_BLOCK))
+        if not block:
+            break
+        # Ключ - фактическая точность, как у Control_
+        accs = [plan.accuracy(len(number.partition('.')[2])) for number in block]
+        cached = cache.get_many(block, plan.pin, plan.pout, accs)
+        for number, c, result in zip(block, accs, cached):
+            line_no += 1
+            if result is None and number:
+                try:
+                    result = plan.convert(number, c)
+                    cache.put(number, plan.pin, plan.pout, c, result)
+                except ValueError as e:
+                    if on_error is not None:
+                        on_error(line_no, str(e))
+                    result = number
+            yield result if number else number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m convertor.batch",
+        description="Пакетное преобразование чисел из системы с основанием pin в pout")
+    parser.add_argument("--pin", type=int, default=10, help="основание исходной системы (2..16)")
+    parser.add_argument("--pout", type=int, default=16, help="основание результирующей системы (2..16)")
+    parser.add_argument("--acc", type=int, default=None,
+                        help="число разрядов дроби результата (по умолчанию - как в Control_)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="число процессов для преобразования (по умолчанию 1 - без пула)")
+    parser.add_argument("--chunk-lines", type=int, default=CHUNK_LINES,
+                        help=f"строк в блоке для пула процессов (по умолчанию {CHUNK_LINES})")
+    parser.add_argument("--cache", default=None,
+                        help="файл постоянного кэша результатов (sqlite, общий для процессов)")
+    parser.add_argument("--cache-size", type=int, default=1_000_000,
+                        help="наибольшее число записей постоянного кэша")
+    parser.add_argument("--single", action="store_true",
+                        help="входной файл - одно число; требует файлов input и --output")
+    parser.add_argument("-o", "--output", default=None, help="файл результатов (по умолчанию - stdout)")
+    parser.add_argument("input", nargs="?", default=None, help="файл с числами (по умолчанию - stdin)")
+    return parser
+
+
+def run(source: TextIO, target: TextIO, plan: ConversionPlan, log: TextIO,
+        cache: Optional[DiskCache] = None) -> int:
+    """Преобразовать все числа source в target; возвращает число ошибок"""
+    errors = 0
+
+    def on_error(line_no: int, message: str) -> None:
+        nonlocal errors
+        errors += 1
+        print(f"Ошибка: строка {line_no}: {message}", file=log)
+
+    results = convert_numbers(read_numbers(source), plan, on_error, cache)
+    target.writelines(result + "\n" for result in results)
+    target.flush()
+    return errors
+
+
+_worker_caches = {}  # Кэши, открытые в процессе пула: (путь, размер) -> DiskCache
+
+
+def convert_block(pin: int, pout: int, acc: Optional[int], first_line: int, block: str,
+                  cache_path: Optional[str] = None,
+                  cache_size: int = 1_000_000) -> Tuple[str, List[Tuple[int, str]]]:
+    """
+    Преобразование блока строк в процессе пула. Блок передается и
+    возвращается одной строкой, чтобы сократить затраты на сериализацию
+    """
+    plan = ConversionPlan.for_bases(pin, pout, acc)
+    cache = None
+    if cache_path is not None:
+        cache = _worker_caches.get((cache_path, cache_size))
+        if cache is None:
+            cache = _worker_caches[(cache_path, cache_size)] = DiskCache(cache_path, cache_size)
+    errors = []
+    lines = block[:-1].split("\n") if block.endswith("\n") else block.split("\n")
+    results = convert_numbers((line.strip() for line in lines), plan,
+                              lambda line_no, message: errors.append((first_line + line_no, message)),
+                              cache)
+    text = "\n".join(results) + "\n"
+    if cache is not None:
+        # Процесс пула завершается без close(): записи блока сохраняются сразу
+        cache.flush()
+    return text, errors
+
+
+def run_parallel(source: TextIO, target: TextIO, plan: ConversionPlan, log: TextIO,
+                 workers: int, chunk_lines: int = CHUNK_LINES,
+                 cache: Optional[DiskCache] = None) -> int:
+    """
+    Преобразовать все числа source в target в пуле из workers процессов.
+    В работе одновременно не более 2 * workers блоков, поэтому память
+    не зависит от размера входа; возвращает число ошибок
+    """
+    errors = 0
+    pending = deque()
+
+    def write_next() -> None:
+        nonlocal errors
+        text, block_errors = pending.popleft().result()
+        target.write(text)
+        for line_no, message in block_errors:
+            errors += 1
+            print(f"Ошибка: строка {line_no}: {message}", file=log)
+
+    cache_args = (cache.path, cache.max_size) if cache is not None else ()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        line_no = 0
+        while True:
+            lines = list(islice(source, chunk_lines))
+            if not lines:
+                break
+            pending.append(pool.submit(convert_block, plan.pin, plan.pout, plan.fixed_accuracy,
+                                       line_no, "".join(lines), *cache_args))
+            line_no += len(lines)
+            if len(pending) >= 2 * workers:
+                write_next()
+        while pending:
+            write_next()
+
+    target.flush()
+    return errors
+
+
+def main(argv: Optional[List[str]] = None, stdin: Optional[TextIO] = None,
+         stdout: Optional[TextIO] = None, stderr: Optional[TextIO] = None) -> int:
+    args = build_parser().parse_args(argv)
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    try:
+        plan = ConversionPlan.for_bases(args.pin, args.pout, args.acc)
+    except ValueError as e:
+        print(f"Ошибка: {e}", file=stderr)
+        return 2
+
+    if args.single:
+        if not args.input or not args.output:
+            print("Ошибка: для --single нужны входной файл и --output", file=stderr)
+            return 2
+        try:
+            Conver_File.do(args.input, args.output, args.pin, args.pout, args.acc)
+        except (OSError, ValueError) as e:
+            print(f"Ошибка: {e}", file=stderr)
+            return 1
+        return 0
+
+    try:
+        cache = DiskCache(args.cache, args.cache_size) if args.cache else None
+    except ValueError as e:
+        print(f"Ошибка: {e}", file=stderr)
+        return 2
+
+    source = open(args.input, encoding="utf-8", buffering=BUFFER_SIZE) if args.input else stdin
+    target = open(args.output, "w", encoding="utf-8", buffering=BUFFER_SIZE) if args.output else stdout
+    try:
+        if args.workers > 1:
+            errors = run_parallel(source, target, plan, stderr, args.workers, max(args.chunk_lines, 1), cache)
+        else:
+            errors = run(source, target, plan, stderr, cache)
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            target.close()
+        if cache is not None:
+            cache.close()
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
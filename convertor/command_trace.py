@@ -0,0 +1,67 @@
+"""
+Компактная двоичная запись трасс команд Control_.
+
+Трасса - заголовок (сигнатура, pin, pout, число команд) и по одному байту
+на команду (коды 0..19). Трассы записываются в файл подряд, поэтому
+миллионы сеансов читаются потоком без разбора текста:
+
+    with open("sessions.cvt", "ab") as f:
+        write_trace(f, 10, 16, [1, 0, 16, 5, Control_.CMD_EXECUTE])
+
+    with open("sessions.cvt", "rb") as f:
+        for results in replay(f):
+            ...
+"""
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from control import Control_
+
+MAGIC = b"CVT1"
+_HEADER = struct.Struct("<4sBBI")  # Сигнатура, pin, pout, число команд
+_COMMANDS = bytes(range(Control_.CMD_EXECUTE + 1))
+
+
+def encode_trace(pin: int, pout: int, commands: Iterable[int]) -> bytes:
+    """Трасса в двоичном виде"""
+    data = bytes(commands)
+    invalid = data.translate(None, _COMMANDS)
+    if invalid:
+        raise ValueError(f"Неизвестная команда: {invalid[0]}")
+    for p in (pin, pout):
+        if p < 2 or p > 16:
+            raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+    return _HEADER.pack(MAGIC, pin, pout, len(data)) + data
+
+
+def write_trace(stream: BinaryIO, pin: int, pout: int, commands: Iterable[int]) -> None:
+    stream.write(encode_trace(pin, pout, commands))
+
+
+def read_traces(stream: BinaryIO) -> Iterator[Tuple[int, int, bytes]]:
+    """Трассы из потока по одной: (pin, pout, команды байтами)"""
+    while True:
+        header = stream.read(_HEADER.size)
+        if not header:
+            return
+        if len(header) < _HEADER.size:
+            raise ValueError("Обрезанный заголовок трассы")
+        magic, pin, pout, count = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"Неверная сигнатура трассы: {magic!r}")
+        commands = stream.read(count)
+        if len(commands) < count:
+            raise ValueError("Обрезанная трасса")
+        yield pin, pout, commands
+
+
+def replay(stream: BinaryIO, outputs: Optional[Iterable[int]] = (Control_.CMD_EXECUTE,)) -> Iterator[List[str]]:
+    """
+    Воспроизвести все трассы потока: каждая выполняется в новом Control_,
+    возвращаются результаты команд из outputs (по умолчанию - выполнения)
+    """
+    for pin, pout, commands in read_traces(stream):
+        control = Control_()
+        control.pin = pin
+        control.pout = pout
+        yield control.run(commands, outputs)
@@ -2,12 +2,15 @@ import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from collections import OrderedDict
+from typing import Iterable, List, Optional
 from enum import Enum
+from fractions import Fraction
 from editor import Editor
 from history import History
+from disk_cache import DiskCache
 from convers.conver_10_p import Conver_10_P
-from convers.conver_p_10 import Conver_P_10
-import math
+from convers.conversion_plan import ConversionPlan, convert
 
 class State(Enum):
     РЕДАКТИРОВАНИЕ = "Редактирование"
@@ -23,18 +26,37 @@ class Control_:
     # Коды команд
     CMD_EXECUTE = 19  # Команда выполнения преобразования
     
-    def __init__(self):
+    # Байтовые коды команд для run() по трассе
+    _EXECUTE_BYTE = bytes([CMD_EXECUTE])
+    _COMMAND_BYTES = bytes(range(CMD_EXECUTE + 1))
+    
+    def __init__(self, cache_size: int = 0, disk_cache: Optional[DiskCache] = None,
+                 history: Optional[History] = None):
         # Создание объектов
         self._editor = Editor()      # Редактор
-        self._history = History()    # История
+        # История (например, History(max_len) для долго работающих приложений)
+        self._history = History() if history is None else history
         
         # Свойства
         self._pin = self.DEFAULT_PIN      # Основание исходной системы счисления
         self._pout = self.DEFAULT_POUT    # Основание результирующей системы счисления
         self._state = State.РЕДАКТИРОВАНИЕ  # Состояние
+        self._plan = ConversionPlan.for_bases(self._pin, self._pout)  # План преобразования
         
         # Дополнительные поля для точности
         self._default_accuracy = self.DEFAULT_ACCURACY
+        
+        # LRU-кэш результатов: (число, pin, pout, точность) -> результат
+        if cache_size < 0:
+            raise ValueError(f"Размер кэша должен быть неотрицательным, получено {cache_size}")
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        
+        # Постоянный кэш на диске (общий для процессов), проверяется после LRU
+        self._disk_cache = disk_cache
     
     # Свойства (аналог свойств в C#)
     @property
@@ -45,6 +67,7 @@ class Control_:
     def pin(self, value: int):
         if 2 <= value <= 16:
             self._pin = value
+            self._plan = ConversionPlan.for_bases(self._pin, self._pout)
         else:
             raise ValueError(f"Основание должно быть в диапазоне 2..16, получено {value}")
     
@@ -56,6 +79,7 @@ class Control_:
     def pout(self, value: int):
         if 2 <= value <= 16:
             self._pout = value
+            self._plan = ConversionPlan.for_bases(self._pin, self._pout)
         else:
             raise ValueError(f"Основание должно быть в диапазоне 2..16, получено {value}")
     
@@ -75,19 +99,79 @@ class Control_:
     def history(self) -> History:
         return self._history
     
+    @property
+    def plan(self) -> ConversionPlan:
+        return self._plan
+    
     def _calculate_accuracy(self) -> int:
         if self._editor.acc() == 0:
             return 0
         
         try:
-            # Формула: round(ed.Acc() * log(Pin) / log(Pout) + 0.5)
-            result = int(round(
-                self._editor.acc() * math.log(self._pin) / math.log(self._pout) + 0.5
-            ))
+            # Формула: round(ed.Acc() * log(Pin) / log(Pout) + 0.5),
+            # отношение логарифмов заранее вычислено в плане
+            result = int(round(self._editor.acc() * self._plan.ratio + 0.5))
             return max(1, result)  # Минимум 1 разряд
         except (ValueError, ZeroDivisionError):
             return self._default_accuracy
     
+    def _convert_cached(self, number: str, accuracy: int) -> str:
+        # Само преобразование - функция convert() без общего состояния;
+        # Control_ добавляет к ней кэш, состояние и историю
+        if not self._cache_size:
+            return self._convert_disk_cached(number, accuracy)
+        
+        key = (number, self._pin, self._pout, accuracy)
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+            return result
+        
+        self._cache_misses += 1
+        result = self._convert_disk_cached(number, accuracy)
+        self._cache[key] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            self._cache_evictions += 1
+        return result
+    
+    def _convert_disk_cached(self, number: str, accuracy: int) -> str:
+        if self._disk_cache is None:
+            return self._convert(number, accuracy)
+        
+        result = self._disk_cache.get(number, self._pin, self._pout, accuracy)
+        if result is None:
+            result = self._convert(number, accuracy)
+            self._disk_cache.put(number, self._pin, self._pout, accuracy, result)
+        return result
+    
+    def _convert(self, number: str, accuracy: int) -> str:
+        # Основания - степени двойки: перегруппировка строки за линейное время
+        if self._plan.pow2:
+            return self._plan.convert(number, accuracy)
+        # Текущее число редактора уже разобрано - берем его значение
+        if number == self._editor.number:
+            int_value, numerator, frac_len = self._editor.value(self._pin)
+            return self._plan.convert_value(int_value, numerator, frac_len, accuracy)
+        return convert(number, self._pin, self._pout, accuracy)
+    
+    def cache_info(self) -> dict:
+        """Статистика кэша результатов: попадания, промахи, вытеснения, размер"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "size": len(self._cache),
+            "max_size": self._cache_size,
+        }
+    
+    def cache_clear(self) -> None:
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+    
     def do_command(self, command: int) -> str:
         # Команда выполнения преобразования
         if command == self.CMD_EXECUTE:
@@ -96,14 +180,11 @@ class Control_:
                 if not self._editor.number or self._editor.number == "0":
                     return "0"
                 
-                # 1. Преобразование из p1 в десятичную систему
-                decimal_value = Conver_P_10.dval(self._editor.number, self._pin)
-                
-                # 2. Расчет точности
+                # 1. Расчет точности
                 accuracy = self._calculate_accuracy()
                 
-                # 3. Преобразование из десятичной в p2
-                result = Conver_10_P.do(decimal_value, self._pout, accuracy)
+                # 2-3. Преобразование из p1 в p2 по готовому плану (или из кэша)
+                result = self._convert_cached(self._editor.number, accuracy)
                 
                 # 4. Изменение состояния
                 self._state = State.ПРЕОБРАЗОВАНО
@@ -128,6 +209,71 @@ class Control_:
             self._state = State.РЕДАКТИРОВАНИЕ
             return self._editor.do_edit(command, self._pin)
     
+    def run(self, commands: Iterable[int], outputs: Optional[Iterable[int]] = (CMD_EXECUTE,)) -> List[str]:
+        """
+        Выполнить поток команд (как do_command для каждой) и вернуть
+        результаты только команд из outputs (None - всех команд).
+        Подряд идущие команды редактирования, результаты которых не нужны,
+        применяются к редактору одним вызовом append_many. Поток может
+        быть байтовой строкой - одна команда на байт (см. command_trace.py)
+        """
+        wanted = None if outputs is None else frozenset(outputs)
+        results = []
+        
+        # Байтовая трасса с результатами только выполнения: команды между
+        # выполнениями передаются в редактор целыми отрезками
+        if isinstance(commands, (bytes, bytearray)) and wanted == {self.CMD_EXECUTE}:
+            invalid = bytes(commands).translate(None, self._COMMAND_BYTES)
+            if invalid:
+                raise ValueError(f"Неизвестная команда: {invalid[0]}")
+            segments = bytes(commands).split(self._EXECUTE_BYTE)
+            for i, segment in enumerate(segments):
+                if segment:
+                    self._editor.append_many(segment, self._pin)
+                    self._state = State.РЕДАКТИРОВАНИЕ
+                if i < len(segments) - 1:
+                    results.append(self.do_command(self.CMD_EXECUTE))
+            return results
+        
+        batch = []
+        for command in commands:
+            emit = wanted is None or command in wanted
+            if not emit and 0 <= command <= Editor.CMD_CLEAR:
+                # Результат правки не нужен - команда копится для append_many
+                batch.append(command)
+                continue
+            
+            if batch:
+                self._editor.append_many(batch, self._pin)
+                self._state = State.РЕДАКТИРОВАНИЕ
+                batch.clear()
+            result = self.do_command(command)
+            if emit:
+                results.append(result)
+        
+        if batch:
+            self._editor.append_many(batch, self._pin)
+            self._state = State.РЕДАКТИРОВАНИЕ
+        return results
+    
+    def convert_all(self, bases=range(2, 17)) -> dict:
+        """
+        Преобразовать текущее число сразу во все основания bases:
+        число разбирается один раз, точность считается для каждого основания.
+        Состояние и история не изменяются
+        """
+        int_value, numerator, frac_len = self._editor.value(self._pin)
+        value = int_value + Fraction(numerator, self._pin ** frac_len)
+        acc = self._editor.acc()
+        accuracy = {p: ConversionPlan.for_bases(self._pin, p).accuracy(acc) for p in bases}
+        return Conver_10_P.do_all(value, accuracy.keys(), accuracy)
+    
+    def set_number(self, text: str) -> str:
+        """Заменить число строкой text в системе pin (вставка целиком)"""
+        number = self._editor.set_number(text, self._pin)
+        self._state = State.РЕДАКТИРОВАНИЕ
+        return number
+    
     def reset(self) -> None:
         self._editor.clear()
         self._state = State.РЕДАКТИРОВАНИЕ
@@ -1,4 +1,48 @@
+from fractions import Fraction
+from itertools import islice
+from typing import Iterator, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не обязателен: пакетные методы работают и без него
+    np = None
+
+
 class Conver_10_P:
+    # Порог (в битах), начиная с которого целая часть переводится
+    # рекурсивным делением на степени p^(2^k) вместо поразрядного цикла
+    DC_THRESHOLD_BITS = 1024
+    
+    # Кэш степеней p^(2^k) по основаниям
+    _POWERS = {}
+    
+    # Основания со встроенным форматом format(n, ...); 'X' - заглавные буквы
+    NATIVE_FORMATS = {2: 'b', 8: 'o', 10: 'd', 16: 'X'}
+    
+    # Наибольший размер таблицы групп цифр: p^k <= CHUNK_TABLE_SIZE
+    CHUNK_TABLE_SIZE = 4096
+    
+    # Таблицы групп по основаниям: p -> (k, p^k, строки из k цифр для 0..p^k-1)
+    _CHUNKS = {}
+    
+    # Таблица символов цифр для пакетного вывода (строится при первом вызове)
+    _CHAR_TABLE = None
+    
+    # Точность, начиная с которой flt_to_p и ConversionPlan ищут период
+    # дроби и дописывают остальные цифры повторением периода
+    PERIOD_THRESHOLD = 64
+    
+    # Период ищется только для знаменателей не длиннее (бит): остатки
+    # хранятся в словаре, и длинные остатки заняли бы слишком много памяти
+    PERIOD_MAX_BITS = 256
+    
+    # Основания - степени меньшего основания: q -> (r, e), q = r^e.
+    # Цифры в основании q получаются группировкой по e цифр основания r
+    ROOTS = {4: (2, 2), 8: (2, 3), 16: (2, 4), 9: (3, 2)}
+    
+    # Таблицы групп: (r, e) -> {группа из e цифр r: цифра r^e}
+    _GROUPS = {}
+    
     @staticmethod
     def int_to_char(d: int) -> str:
         if 0 <= d <= 9:
@@ -8,6 +52,72 @@ class Conver_10_P:
         else:
             raise ValueError(f"Значение {d} вне диапазона 0-15")
     
+    @staticmethod
+    def _int_to_p_digits(n: int, p: int) -> str:
+        # Поразрядный цикл деления
+        result = []
+        while n > 0:
+            digit = n % p
+            result.append(Conver_10_P.int_to_char(digit))
+            n //= p
+        
+        return ''.join(reversed(result)) if result else '0'
+    
+    @staticmethod
+    def _chunk_table(p: int):
+        chunks = Conver_10_P._CHUNKS.get(p)
+        if chunks is None:
+            k = 1
+            while p ** (k + 1) <= Conver_10_P.CHUNK_TABLE_SIZE:
+                k += 1
+            table = tuple(Conver_10_P._int_to_p_digits(v, p).rjust(k, '0') for v in range(p ** k))
+            chunks = (k, p ** k, table)
+            Conver_10_P._CHUNKS[p] = chunks
+        return chunks
+    
+    @staticmethod
+    def _int_to_p_simple(n: int, p: int) -> str:
+        # Основания 2, 8, 10, 16 - встроенный format()
+        fmt = Conver_10_P.NATIVE_FORMATS.get(p)
+        if fmt is not None:
+            return format(n, fmt)
+        
+        # Деление сразу на p^k: одна итерация - k цифр из таблицы групп
+        k, base, table = Conver_10_P._chunk_table(p)
+        result = []
+        while n >= base:
+            n, chunk = divmod(n, base)
+            result.append(table[chunk])
+        result.append(table[n].lstrip('0') or '0')
+        
+        return ''.join(reversed(result))
+    
+    @staticmethod
+    def _powers(n: int, p: int) -> list:
+        # Степени p^(2^k), не превосходящие n (кэшируются между вызовами;
+        # как и в Conver_P_10._power, кэш дополняется заменой списка)
+        powers = Conver_10_P._POWERS.get(p) or [p]
+        if powers[-1] <= n:
+            powers = powers.copy()
+            while powers[-1] <= n:
+                powers.append(powers[-1] * powers[-1])
+            Conver_10_P._POWERS[p] = powers
+        
+        return powers
+    
+    @staticmethod
+    def _int_to_p_dc(n: int, p: int, powers: list, k: int) -> str:
+        # Малые числа - обычный цикл деления
+        if k < 0 or n.bit_length() <= Conver_10_P.DC_THRESHOLD_BITS:
+            return Conver_10_P._int_to_p_simple(n, p)
+        
+        # n < p^(2^(k+1)): старшая половина и младшие 2^k разрядов
+        hi, lo = divmod(n, powers[k])
+        lo_str = Conver_10_P._int_to_p_dc(lo, p, powers, k - 1).rjust(1 << k, '0')
+        if hi == 0:
+            return lo_str
+        return Conver_10_P._int_to_p_dc(hi, p, powers, k - 1) + lo_str
+    
     @staticmethod
     def int_to_p(n: int, p: int) -> str:
         if p < 2 or p > 16:
@@ -19,17 +129,105 @@ class Conver_10_P:
         is_negative = n < 0
         n = abs(n)
         
-        result = []
-        while n > 0:
-            digit = n % p
-            result.append(Conver_10_P.int_to_char(digit))
-            n //= p
+        if n.bit_length() <= Conver_10_P.DC_THRESHOLD_BITS or p in (2, 8, 16):
+            # Малые числа и основания 2, 8, 16 (format() линеен) - без рекурсии
+            result_str = Conver_10_P._int_to_p_simple(n, p)
+        else:
+            # Разделяй и властвуй по степеням p^(2^k)
+            powers = Conver_10_P._powers(n, p)
+            k = len(powers) - 2
+            while powers[k] > n:
+                k -= 1
+            result_str = Conver_10_P._int_to_p_dc(n, p, powers, k).lstrip('0')
         
-        result_str = ''.join(reversed(result))
         return '-' + result_str if is_negative else result_str
     
     @staticmethod
-    def flt_to_p(n: float, p: int, c: int) -> str:
+    def _fraction_digits(numerator: int, denominator: int, p: int) -> Iterator[str]:
+        # Точная арифметика: остаток хранится как числитель над знаменателем
+        while numerator:
+            digit, numerator = divmod(numerator * p, denominator)
+            yield Conver_10_P.int_to_char(digit)
+    
+    @staticmethod
+    def iter_fraction_digits(n: Union[float, Fraction], p: int) -> Iterator[str]:
+        """
+        Ленивый генератор цифр дроби n из [0, 1) в системе с основанием p.
+        Цифры вычисляются по запросу; конечная дробь завершает генератор
+        сразу после последней ненулевой цифры
+        """
+        if p < 2 or p > 16:
+            raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+        
+        if n < 0 or n >= 1:
+            raise ValueError(f"Дробь {n} должна быть в диапазоне [0, 1)")
+        
+        fraction = Fraction(n)
+        return Conver_10_P._fraction_digits(fraction.numerator, fraction.denominator, p)
+    
+    @staticmethod
+    def fraction_period(n: Union[float, Fraction], p: int,
+                        limit: Optional[int] = None) -> Optional[Tuple[str, str]]:
+        """
+        Предпериод и период дроби n из [0, 1) в системе с основанием p.
+        Повтор остатка отслеживается по словарю: остаток -> номер цифры.
+        Для конечной дроби период - пустая строка. Если limit задан и
+        период не найден за limit цифр, возвращается None. Число float
+        берется по его кратчайшей десятичной записи (0.1 - это 1/10)
+        """
+        if p < 2 or p > 16:
+            raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+        
+        if n < 0 or n >= 1:
+            raise ValueError(f"Дробь {n} должна быть в диапазоне [0, 1)")
+        
+        fraction = Conver_10_P._decimal_fraction(n)
+        numerator, denominator = fraction.numerator, fraction.denominator
+        seen = {}
+        digits = []
+        while numerator and numerator not in seen:
+            if limit is not None and len(digits) >= limit:
+                return None
+            seen[numerator] = len(digits)
+            digit, numerator = divmod(numerator * p, denominator)
+            digits.append(Conver_10_P.int_to_char(digit))
+        
+        if not numerator:
+            return ''.join(digits), ''
+        
+        start = seen[numerator]
+        return ''.join(digits[:start]), ''.join(digits[start:])
+    
+    @staticmethod
+    def _decimal_fraction(n: Union[int, float, Fraction]) -> Fraction:
+        # Точное двоичное значение float (у 0.1 знаменатель 2^55) дало бы
+        # период длиной около 2^53 цифр - поиск периода не завершился бы
+        return Fraction(repr(n)) if isinstance(n, float) else Fraction(n)
+    
+    @staticmethod
+    def do_periodic(n: Union[int, float, Fraction], p: int) -> str:
+        """
+        Запись числа с выделенным периодом дроби, например 0.(0022).
+        Число float берется по его кратчайшей десятичной записи
+        """
+        if p < 2 or p > 16:
+            raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+        
+        value = Conver_10_P._decimal_fraction(n)
+        is_negative = value < 0
+        value = abs(value)
+        int_part = value.numerator // value.denominator
+        frac_part = value - int_part
+        
+        result = Conver_10_P.int_to_p(int_part, p)
+        if frac_part > 0:
+            pre_period, period = Conver_10_P.fraction_period(frac_part, p)
+            result = f"{result}.{pre_period}({period})" if period else f"{result}.{pre_period}"
+        
+        return '-' + result if is_negative else result
+    
+    @staticmethod
+    def flt_to_p(n: Union[float, Fraction], p: int, c: int) -> str:
         if p < 2 or p > 16:
             raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
         
@@ -39,14 +237,25 @@ class Conver_10_P:
         if c < 0:
             raise ValueError(f"Точность {c} должна быть неотрицательной")
         
-        result = []
-        fraction = n
+        fraction = Fraction(n)
+        return Conver_10_P._fraction_to_p(fraction.numerator, fraction.denominator, p, c)
+    
+    @staticmethod
+    def _fraction_to_p(numerator: int, denominator: int, p: int, c: int) -> str:
+        # c цифр дроби numerator / denominator из [0, 1) без незначащих нулей
+        found = None
+        if c > Conver_10_P.PERIOD_THRESHOLD and denominator.bit_length() <= Conver_10_P.PERIOD_MAX_BITS:
+            # Высокая точность: цифры после периода - его повторение
+            found = Conver_10_P.fraction_period(Fraction(numerator, denominator), p, c)
         
-        for _ in range(c):
-            fraction *= p
-            digit = int(fraction)
-            result.append(Conver_10_P.int_to_char(digit))
-            fraction -= digit
+        if found:
+            pre_period, period = found
+            if period:
+                repeats = -(-(c - len(pre_period)) // len(period))
+                pre_period += period * repeats
+            result = list(pre_period[:c])
+        else:
+            result = list(islice(Conver_10_P._fraction_digits(numerator, denominator, p), c))
         
         # Удаление незначащих нулей в конце
         while result and result[-1] == '0':
@@ -55,20 +264,192 @@ class Conver_10_P:
         return ''.join(result) if result else '0'
     
     @staticmethod
-    def do(n: float, p: int, c: int) -> str:
+    def do(n: Union[int, float, Fraction], p: int, c: int) -> str:
         if p < 2 or p > 16:
             raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
         
+        # Точное значение (int, float или Fraction) без потери разрядов
+        value = Fraction(n)
+        is_negative = value < 0
+        value = abs(value)
+        
         # Отделение целой и дробной части
-        int_part = int(n)
-        frac_part = abs(n - int_part)
+        int_part = value.numerator // value.denominator
+        frac_part = value - int_part
         
         # Преобразование целой части
-        int_str = Conver_10_P.int_to_p(int_part, p)
+        result = Conver_10_P.int_to_p(int_part, p)
         
         # Преобразование дробной части (если она есть и требуется точность)
         if frac_part > 0 and c > 0:
             frac_str = Conver_10_P.flt_to_p(frac_part, p, c)
-            return f"{int_str}.{frac_str}" if frac_str else int_str
+            result = f"{result}.{frac_str}" if frac_str else result
+        
+        # Знак ставится только перед ненулевым результатом
+        return '-' + result if is_negative and result.strip('0.') else result
+    
+    @staticmethod
+    def _regroup(digits: str, r: int, e: int) -> str:
+        # Группировка по e цифр основания r в цифры основания r^e
+        table = Conver_10_P._GROUPS.get((r, e))
+        if table is None:
+            table = {}
+            for d in range(r ** e):
+                table[Conver_10_P._int_to_p_simple(d, r).rjust(e, '0')] = Conver_10_P.int_to_char(d)
+            Conver_10_P._GROUPS[(r, e)] = table
+        return ''.join([table[digits[i:i + e]] for i in range(0, len(digits), e)])
+    
+    @staticmethod
+    def do_all(n: Union[int, float, Fraction], bases=range(2, 17), c=0) -> dict:
+        """
+        Преобразование одного значения сразу во все основания bases.
+        Точность c - число или словарь {основание: точность}. Разряды
+        считаются один раз для каждого корня (2 для 4, 8, 16; 3 для 9),
+        остальные основания получаются группировкой цифр корня
+        """
+        bases = list(bases)
+        for p in bases:
+            if p < 2 or p > 16:
+                raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+        
+        accuracy = c if isinstance(c, dict) else dict.fromkeys(bases, c)
+        
+        # Точное значение разбирается один раз
+        value = Fraction(n)
+        is_negative = value < 0
+        value = abs(value)
+        int_part = value.numerator // value.denominator
+        frac_part = value - int_part
+        
+        # Сколько дробных цифр нужно каждому корню
+        frac_needed = {}
+        for p in bases:
+            r, e = Conver_10_P.ROOTS.get(p, (p, 1))
+            frac_needed[r] = max(frac_needed.get(r, 0), max(accuracy[p], 0) * e)
+        
+        # Цифры целой и дробной частей для каждого корня
+        int_digits = {}
+        frac_digits = {}
+        for r, count in frac_needed.items():
+            int_digits[r] = Conver_10_P.int_to_p(int_part, r)
+            digits = Conver_10_P._fraction_digits(frac_part.numerator, frac_part.denominator, r)
+            frac_digits[r] = ''.join(islice(digits, count))
+        
+        results = {}
+        for p in bases:
+            r, e = Conver_10_P.ROOTS.get(p, (p, 1))
+            c_p = accuracy[p]
+            result = int_digits[r]
+            frac_str = frac_digits[r][:c_p * e]
+            if e > 1:
+                result = Conver_10_P._regroup(result.rjust(-(-len(result) // e) * e, '0'), r, e).lstrip('0') or '0'
+                frac_str = Conver_10_P._regroup(frac_str.ljust(-(-len(frac_str) // e) * e, '0'), r, e)
+            
+            if frac_part > 0 and c_p > 0:
+                result = f"{result}.{frac_str.rstrip('0') or '0'}"
+            
+            # Знак ставится только перед ненулевым результатом
+            results[p] = '-' + result if is_negative and result.strip('0.') else result
+        
+        return results
+    
+    @staticmethod
+    def do_many(values, p: int, c: int) -> list:
+        """
+        Пакетный аналог do для последовательности или массива чисел.
+        С NumPy разряды считаются столбцами (divmod для всех чисел сразу),
+        символы берутся из таблицы; значения вне диапазона uint64 и дроби
+        с разрядами младше 2^-60 обрабатываются через do.
+        """
+        if p < 2 or p > 16:
+            raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+        
+        if np is None:
+            return [Conver_10_P.do(n, p, c) for n in values]
+        
+        x = np.asarray(values).reshape(-1)
+        if len(x) == 0 or x.dtype.kind not in 'iuf':
+            return [Conver_10_P.do(n, p, c) for n in x.tolist()]
+        
+        n = len(x)
+        frac_bits = 60  # p * 2^60 < 2^64 - умножение дробной части без переполнения
+        is_negative = x < 0
+        if x.dtype.kind == 'f':
+            a = np.abs(x)
+            ok = np.isfinite(a) & (a < 2.0 ** 64)
+            a = np.where(ok, a, 0.0)
+            int_float = np.floor(a)
+            frac_scaled = np.ldexp(a - int_float, frac_bits)
+            ok &= frac_scaled == np.floor(frac_scaled)
+            int_part = int_float.astype(np.uint64)
+            frac = frac_scaled.astype(np.uint64)
         else:
-            return int_str
\ No newline at end of file
+            ok = np.ones(n, dtype=bool)
+            int_part = np.where(is_negative, -(x + 1), x).astype(np.uint64)
+            int_part += is_negative
+            frac = np.zeros(n, dtype=np.uint64)
+        
+        # Целая часть: младшие разряды первыми
+        up = np.uint64(p)
+        int_digits = []
+        rest = int_part.copy()
+        while True:
+            int_digits.append(rest % up)
+            rest //= up
+            if not rest.any():
+                break
+        int_len = np.maximum(len(int_digits) - (np.stack(int_digits[::-1], axis=1) != 0).argmax(axis=1), 1)
+        int_len = np.where(int_part == 0, 1, int_len)
+        
+        # Дробная часть: остаток - числитель над 2^60
+        frac_present = (frac > 0) & (c > 0)
+        frac_digits = []
+        low_mask = np.uint64((1 << frac_bits) - 1)
+        for _ in range(max(c, 0)):
+            if not frac.any():
+                break
+            frac = frac * up
+            frac_digits.append(frac >> np.uint64(frac_bits))
+            frac &= low_mask
+        if not frac_digits:
+            frac_digits.append(np.zeros(n, dtype=np.uint64))
+        frac_matrix = np.stack(frac_digits, axis=1)
+        m = frac_matrix.shape[1]
+        nonzero = frac_matrix != 0
+        frac_len = np.where(nonzero.any(axis=1), m - nonzero[:, ::-1].argmax(axis=1), 0)
+        has_value = (int_part != 0) | (frac_present & (frac_len > 0))
+        frac_len = np.where(frac_present, np.maximum(frac_len, 1), 0)
+        
+        # Матрица символов: знак, цифры целой части, разделитель, цифры дроби
+        k = len(int_digits)
+        chars = Conver_10_P._char_table()
+        codes = np.concatenate([
+            np.full((n, 1), ord('-'), dtype=np.uint32),
+            chars[np.stack(int_digits[::-1], axis=1)],
+            np.full((n, 1), ord('.'), dtype=np.uint32),
+            chars[frac_matrix],
+        ], axis=1)
+        present = np.concatenate([
+            (is_negative & has_value)[:, None],
+            np.arange(k)[None, :] >= (k - int_len)[:, None],
+            frac_present[:, None],
+            np.arange(m)[None, :] < frac_len[:, None],
+        ], axis=1)
+        
+        # Сдвиг присутствующих символов влево, остальные - дополнение нулями
+        order = np.argsort(~present, axis=1, kind='stable')
+        codes = np.take_along_axis(np.where(present, codes, 0), order, axis=1)
+        width = codes.shape[1]
+        result = np.ascontiguousarray(codes).view(np.dtype(('U', width))).reshape(-1).tolist()
+        
+        for i in np.flatnonzero(~ok).tolist():
+            result[i] = Conver_10_P.do(x[i].item(), p, c)
+        return result
+    
+    @staticmethod
+    def _char_table():
+        # Таблица значение цифры -> код символа
+        if Conver_10_P._CHAR_TABLE is None:
+            Conver_10_P._CHAR_TABLE = np.array(
+                [ord(Conver_10_P.int_to_char(d)) for d in range(16)], dtype=np.uint32)
+        return Conver_10_P._CHAR_TABLE
@@ -0,0 +1,148 @@
+import mmap
+from typing import BinaryIO, Optional
+
+from convers.conver_10_p import Conver_10_P
+from convers.conver_p_10 import Conver_P_10
+from convers.conversion_plan import ConversionPlan
+
+
+class Conver_File:
+    """
+    Преобразование одного очень длинного числа из файла в файл.
+    Входной файл отображается в память (mmap) и разбирается рекурсивно
+    по половинам; цифры результата пишутся в файл по мере получения,
+    поэтому в памяти одновременно находится лишь несколько целых чисел
+    порядка двоичного размера исходного числа
+    """
+
+    # Число цифр входа, разбираемых за один раз
+    LEAF_DIGITS = 1 << 16
+
+    # Размер (в битах) части результата, переводимой за один раз
+    LEAF_BITS = 1 << 16
+
+    WHITESPACE = b" \t\r\n"
+
+    @staticmethod
+    def _parse(data, start: int, end: int, P: int) -> int:
+        # Цифры data[start:end] как целое: hi * P^(2^k) + lo
+        if end - start <= Conver_File.LEAF_DIGITS:
+            return Conver_P_10._convert_int(data[start:end].decode('ascii', 'replace'), P)
+
+        k = (end - start - 1).bit_length() - 1
+        split = end - (1 << k)
+        hi = Conver_File._parse(data, start, split, P)
+        lo = Conver_File._parse(data, split, end, P)
+        return hi * Conver_P_10._power(P, k) + lo
+
+    @staticmethod
+    def _write_int(out: BinaryIO, n: int, p: int, width: int = 0) -> None:
+        """
+        Запись n в основании p (с дополнением нулями слева до width цифр).
+        Стек хранит еще не записанные младшие части, а обработанное число
+        сразу освобождается
+        """
+        # Степени p^(2^k) и их длины в цифрах
+        powers = [p]
+        while powers[-1].bit_length() * 2 <= n.bit_length() + 1:
+            powers.append(powers[-1] * powers[-1])
+        shift = p.bit_length() - 1 if p & (p - 1) == 0 else 0
+        # Для p = 10 часть пишется встроенным format(), который ограничивает
+        # длину десятичной записи (sys.set_int_max_str_digits)
+        leaf_bits = Conver_File.LEAF_BITS if p != 10 else min(Conver_File.LEAF_BITS,
+                                                               Conver_10_P.DC_THRESHOLD_BITS)
+
+        stack = [(n, len(powers) - 1, width)]
+        del n
+        while stack:
+            value, k, pad = stack.pop()
+            if k < 0 or value.bit_length() <= leaf_bits:
+                digits = Conver_10_P._int_to_p_simple(value, p) if value or not pad else ''
+                out.write(digits.rjust(pad, '0').encode('ascii'))
+                continue
+
+            if value < powers[k]:
+                # Старшая половина пуста - только младшие 2^k цифр
+                stack.append((value, k - 1, pad))
+                continue
+
+            # Основания - степени двойки делятся сдвигом
+            if shift:
+                bits = shift << k
+                hi, lo = value >> bits, value & ((1 << bits) - 1)
+            else:
+                hi, lo = divmod(value, powers[k])
+            del value
+            stack.append((lo, k - 1, 1 << k))
+            stack.append((hi, k - 1, max(pad - (1 << k), 0)))
+            del hi, lo
+
+    @staticmethod
+    def do(src_path: str, dst_path: str, pin: int, pout: int, c: Optional[int] = None) -> None:
+        """
+        Преобразовать число из файла src_path (основание pin) в файл dst_path
+        (основание pout). Точность c по умолчанию - как в Control_
+        """
+        plan = ConversionPlan.for_bases(pin, pout, c)
+
+        with open(src_path, 'rb') as src:
+            if src.seek(0, 2) == 0:
+                raise ValueError("Пустая строка недопустима")
+            data = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            # Границы числа без пробельных символов по краям
+            start, end = 0, len(data)
+            while start < end and data[start] in Conver_File.WHITESPACE:
+                start += 1
+            while end > start and data[end - 1] in Conver_File.WHITESPACE:
+                end -= 1
+            if start == end:
+                raise ValueError("Пустая строка недопустима")
+
+            is_negative = data[start] == ord('-')
+            if is_negative:
+                start += 1
+
+            dot = data.find(b'.', start, end)
+            if dot >= 0 and data.find(b'.', dot + 1, end) >= 0:
+                raise ValueError(f"Некорректный формат числа в файле {src_path}")
+            int_end = dot if dot >= 0 else end
+            frac_len = end - dot - 1 if dot >= 0 else 0
+
+            int_value = Conver_File._parse(data, start, int_end, pin)
+
+            # Дробная часть: первые c цифр как целое floor(num * pout^c / pin^len)
+            c = plan.accuracy(frac_len)
+            frac_digits = None
+            if frac_len:
+                numerator = Conver_File._parse(data, dot + 1, end, pin)
+                if numerator > 0 and c > 0:
+                    frac_digits = numerator * pout ** c // pin ** frac_len
+                del numerator
+        finally:
+            data.close()
+
+        # Незначащие нули дроби: двоичный поиск по степеням pout^(2^k)
+        if frac_digits is not None:
+            if frac_digits == 0:
+                c = 1
+            else:
+                powers = [pout]
+                while len(powers) - 1 < c.bit_length():
+                    powers.append(powers[-1] * powers[-1])
+                for k in range(len(powers) - 1, -1, -1):
+                    q, r = divmod(frac_digits, powers[k])
+                    if r == 0 and (1 << k) < c:
+                        frac_digits, c = q, c - (1 << k)
+                del powers
+
+        with open(dst_path, 'wb', buffering=1 << 20) as out:
+            # Знак ставится только перед ненулевым результатом
+            if is_negative and (int_value or frac_digits):
+                out.write(b'-')
+            Conver_File._write_int(out, int_value, pout)
+            del int_value
+            if frac_digits is not None:
+                out.write(b'.')
+                Conver_File._write_int(out, frac_digits, pout, c)
@@ -1,4 +1,30 @@
+import sys
+from fractions import Fraction
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не обязателен: пакетные методы работают и без него
+    np = None
+
+
 class Conver_P_10:
+    # Длина строки, начиная с которой разряды разбираются
+    # рекурсивно по половинам вместо схемы Горнера
+    DC_THRESHOLD_DIGITS = 256
+    
+    # Кэш степеней P^(2^k) по основаниям
+    _POWERS = {}
+    
+    # Наибольшее число значений в группе из k цифр: P^k <= CHUNK_TABLE_SIZE
+    CHUNK_TABLE_SIZE = 4096
+    
+    # Таблицы групп по основаниям: P -> (k, P^k, {строка из k цифр: значение})
+    _CHUNKS = {}
+    
+    # Таблица значений цифр для пакетного разбора (строится при первом вызове)
+    _DIGIT_TABLE = None
+    
     @staticmethod
     def char_to_num(ch: str) -> int:
         if '0' <= ch <= '9':
@@ -23,7 +49,107 @@ class Conver_P_10:
         return result
     
     @staticmethod
-    def dval(P_num: str, P: int) -> float:
+    def _convert_int_digits(P_num: str, P: int) -> int:
+        # Точное накопление по схеме Горнера в целом числе Python
+        result = 0
+        for ch in P_num:
+            digit = Conver_P_10.char_to_num(ch)
+            if digit >= P:
+                raise ValueError(f"Недопустимая цифра '{ch}' для системы счисления с основанием {P}")
+            result = result * P + digit
+        
+        return result
+    
+    @staticmethod
+    def _chunk_table(P: int):
+        chunks = Conver_P_10._CHUNKS.get(P)
+        if chunks is None:
+            k = 1
+            while P ** (k + 1) <= Conver_P_10.CHUNK_TABLE_SIZE:
+                k += 1
+            
+            # Все группы из k допустимых символов (в любом регистре)
+            table = {'': 0}
+            symbols = [ch for ch in "0123456789ABCDEFabcdef" if Conver_P_10.char_to_num(ch) < P]
+            for _ in range(k):
+                table = {prefix + ch: value * P + Conver_P_10.char_to_num(ch)
+                         for prefix, value in table.items() for ch in symbols}
+            chunks = (k, P ** k, table)
+            Conver_P_10._CHUNKS[P] = chunks
+        return chunks
+    
+    @staticmethod
+    def _convert_int_simple(P_num: str, P: int) -> int:
+        # Схема Горнера по группам из k цифр: одна итерация - k цифр
+        k, base, table = Conver_P_10._chunk_table(P)
+        head = len(P_num) % k
+        try:
+            result = Conver_P_10._convert_int_digits(P_num[:head], P)
+            for i in range(head, len(P_num), k):
+                result = result * base + table[P_num[i:i + k]]
+        except KeyError:
+            # Недопустимый символ - поразрядный разбор сообщит, какой
+            return Conver_P_10._convert_int_digits(P_num, P)
+        
+        return result
+    
+    @staticmethod
+    def _power(P: int, k: int) -> int:
+        # P^(2^k) из кэша степеней основания. Список не изменяется после
+        # публикации - дополненная копия заменяет его целиком, поэтому
+        # параллельные вызовы из потоков видят только готовые степени
+        powers = Conver_P_10._POWERS.get(P) or [P]
+        if len(powers) <= k:
+            powers = powers.copy()
+            while len(powers) <= k:
+                powers.append(powers[-1] * powers[-1])
+            Conver_P_10._POWERS[P] = powers
+        
+        return powers[k]
+    
+    @staticmethod
+    def _convert_int_native(P_num: str, P: int) -> Optional[int]:
+        # Встроенный int(s, P) - только для строк из латинских букв и цифр
+        # (int() допускает также пробелы, '_', '+', цифры других алфавитов
+        # и префиксы 0x, 0o, 0b при основаниях 16, 8, 2)
+        if not (P_num.isascii() and P_num.isalnum()):
+            return None
+        if P in (2, 8, 16) and P_num[:1] == '0' and P_num[1:2] in ("x", "X", "o", "O", "b", "B"):
+            return None
+        
+        # Для оснований не степеней двойки int() ограничивает длину строки
+        # (предел настраивается, но не бывает меньше 640 цифр)
+        if P & (P - 1) and len(P_num) > 640:
+            limit = getattr(sys, "get_int_max_str_digits", lambda: 0)()
+            if limit and len(P_num) > limit:
+                return None
+        
+        try:
+            return int(P_num, P)
+        except ValueError:
+            # Цифра вне основания - сообщение об ошибке даст собственный разбор
+            return None
+    
+    @staticmethod
+    def _convert_int(P_num: str, P: int) -> int:
+        # Допустимые строки - встроенным int()
+        value = Conver_P_10._convert_int_native(P_num, P)
+        if value is not None:
+            return value
+        
+        # Короткие строки - схема Горнера
+        if len(P_num) <= Conver_P_10.DC_THRESHOLD_DIGITS:
+            return Conver_P_10._convert_int_simple(P_num, P)
+        
+        # Младшая половина - 2^k разрядов: hi * P^(2^k) + lo
+        k = (len(P_num) - 1).bit_length() - 1
+        split = len(P_num) - (1 << k)
+        hi = Conver_P_10._convert_int(P_num[:split], P)
+        lo = Conver_P_10._convert_int(P_num[split:], P)
+        return hi * Conver_P_10._power(P, k) + lo
+    
+    @staticmethod
+    def _split(P_num: str, P: int):
         # Проверка входных данных
         if P < 2 or P > 16:
             raise ValueError(f"Основание системы счисления {P} должно быть в диапазоне 2..16")
@@ -46,18 +172,99 @@ class Conver_P_10:
         
         int_part = parts[0]
         frac_part = parts[1] if len(parts) == 2 else ""
+        return is_negative, int_part, frac_part
+    
+    @staticmethod
+    def dval_exact(P_num: str, P: int) -> Fraction:
+        """Точное значение числа: целая часть - int, дробная - рациональная дробь"""
+        is_negative, int_part, frac_part = Conver_P_10._split(P_num, P)
         
         # Преобразование целой части
-        result = 0.0
-        if int_part:
-            # Вес старшего разряда целой части = P^(len-1)
-            weight = P ** (len(int_part) - 1)
-            result += Conver_P_10._convert(int_part, P, weight)
+        int_value = Conver_P_10._convert_int(int_part, P) if int_part else 0
         
-        # Преобразование дробной части
+        # Преобразование дробной части: числитель / P^len
         if frac_part:
-            # Вес первого разряда дробной части = 1/P
-            weight = 1.0 / P
-            result += Conver_P_10._convert(frac_part, P, weight)
+            denominator = P ** len(frac_part)
+            numerator = Conver_P_10._convert_int(frac_part, P)
+            result = Fraction(int_value * denominator + numerator, denominator)
+        else:
+            result = Fraction(int_value)
         
-        return -result if is_negative else result
\ No newline at end of file
+        return -result if is_negative else result
+    
+    @staticmethod
+    def dval(P_num: str, P: int) -> float:
+        # Округление точного значения до ближайшего float
+        return float(Conver_P_10.dval_exact(P_num, P))
+    
+    @staticmethod
+    def dval_many(P_nums, P: int) -> list:
+        """
+        Пакетный аналог dval для последовательности или массива строк.
+        С NumPy строки разбираются столбцами (схема Горнера по позициям
+        для всех чисел сразу); числа, не помещающиеся в 53 бита,
+        и некорректные строки обрабатываются через dval.
+        """
+        if P < 2 or P > 16:
+            raise ValueError(f"Основание системы счисления {P} должно быть в диапазоне 2..16")
+        
+        if np is None:
+            return [Conver_P_10.dval(P_num, P) for P_num in P_nums]
+        
+        arr = np.asarray(P_nums, dtype=str).reshape(-1)
+        width = arr.dtype.itemsize // 4
+        if len(arr) == 0 or width == 0:
+            return [Conver_P_10.dval(str(P_num), P) for P_num in arr]
+        
+        n = len(arr)
+        codes = np.ascontiguousarray(arr).view(np.uint32).reshape(n, width)
+        digits = Conver_P_10._digit_table()[np.minimum(codes, 127)]
+        
+        # Классификация позиций: дополнение, разделитель, знак, цифра
+        cols = np.arange(width)
+        is_pad = codes == 0
+        is_dot = codes == ord('.')
+        is_neg = codes[:, 0] == ord('-')
+        is_digit = ~(is_pad | is_dot)
+        is_digit[:, 0] &= ~is_neg
+        length = width - is_pad.sum(axis=1)
+        has_dot = is_dot.any(axis=1)
+        dot_pos = np.where(has_dot, is_dot.argmax(axis=1), width)
+        n_digits = is_digit.sum(axis=1)
+        frac_len = (is_digit & (cols > dot_pos[:, None])).sum(axis=1)
+        
+        # Строки, для которых результат точен: все цифры < P, не более
+        # одного разделителя, P^(число цифр) <= 2^53
+        max_digits = 0
+        while P ** (max_digits + 1) <= 2 ** 53:
+            max_digits += 1
+        ok = (length > 0) & (is_dot.sum(axis=1) <= 1) & (n_digits <= max_digits)
+        ok &= ~(is_pad & (cols < length[:, None])).any(axis=1)
+        ok &= ~(is_digit & (digits >= P)).any(axis=1)
+        
+        # Схема Горнера по столбцам: все цифры числа как одно целое
+        total = np.zeros(n, dtype=np.int64)
+        mask = is_digit & ok[:, None]
+        for j in range(width):
+            total = np.where(mask[:, j], total * P + digits[:, j], total)
+        
+        # Одно деление точных float дает корректно округленный результат
+        powers = np.array([float(P ** k) for k in range(max_digits + 1)])
+        values = total.astype(np.float64) / powers[np.where(ok, frac_len, 0)]
+        values = np.where(is_neg & (total != 0), -values, values)
+        
+        result = values.tolist()
+        for i in np.flatnonzero(~ok).tolist():
+            result[i] = Conver_P_10.dval(str(arr[i]), P)
+        return result
+    
+    @staticmethod
+    def _digit_table():
+        # Таблица кодов символов ASCII -> значение цифры (99 - не цифра)
+        table = Conver_P_10._DIGIT_TABLE
+        if table is None:
+            table = np.full(128, 99, dtype=np.int64)
+            for ch in "0123456789ABCDEFabcdef":
+                table[ord(ch)] = Conver_P_10.char_to_num(ch)
+            Conver_P_10._DIGIT_TABLE = table
+        return table
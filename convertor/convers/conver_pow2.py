@@ -0,0 +1,81 @@
+DIGITS = "0123456789ABCDEF"
+
+
+def _build_tables(p: int, w: int):
+    # Таблицы: символ цифры -> группа битов, группа битов -> символ цифры
+    decode = {}
+    encode = {}
+    for d in range(p):
+        group = format(d, f"0{w}b")
+        decode[ord(DIGITS[d])] = group
+        decode[ord(DIGITS[d].lower())] = group
+        encode[group] = DIGITS[d]
+    return decode, encode
+
+
+class Conver_Pow2:
+    """
+    Прямое преобразование между основаниями 2, 4, 8 и 16
+    перегруппировкой двоичных разрядов (без промежуточного значения)
+    """
+
+    # Число двоичных разрядов на одну цифру
+    BITS = {2: 1, 4: 2, 8: 3, 16: 4}
+
+    _TABLES = {p: _build_tables(p, w) for p, w in BITS.items()}
+
+    @staticmethod
+    def is_applicable(pin: int, pout: int) -> bool:
+        return pin in Conver_Pow2.BITS and pout in Conver_Pow2.BITS
+
+    @staticmethod
+    def _to_bits(P_num: str, P: int) -> str:
+        table = Conver_Pow2._TABLES[P][0]
+        # Проверка всех цифр за один проход
+        if not set(map(ord, P_num)).issubset(table):
+            bad = next(ch for ch in P_num if ord(ch) not in table)
+            raise ValueError(f"Недопустимая цифра '{bad}' для системы счисления с основанием {P}")
+        return P_num.translate(table)
+
+    @staticmethod
+    def _from_bits(bits: str, P: int) -> str:
+        w = Conver_Pow2.BITS[P]
+        table = Conver_Pow2._TABLES[P][1]
+        return ''.join([table[bits[i:i + w]] for i in range(0, len(bits), w)])
+
+    @staticmethod
+    def do(P_num: str, pin: int, pout: int, c: int) -> str:
+        if not Conver_Pow2.is_applicable(pin, pout):
+            raise ValueError(f"Основания {pin} и {pout} должны быть степенями двойки из 2..16")
+
+        if not P_num:
+            raise ValueError("Пустая строка недопустима")
+
+        # Обработка знака
+        is_negative = P_num[0] == '-'
+        num_str = P_num[1:] if is_negative else P_num
+
+        # Разделение на целую и дробную части
+        parts = num_str.split('.')
+        if len(parts) > 2:
+            raise ValueError(f"Некорректный формат числа: {P_num}")
+
+        int_part = parts[0]
+        frac_part = parts[1] if len(parts) == 2 else ""
+        w = Conver_Pow2.BITS[pout]
+
+        # Целая часть: дополнение нулями слева до кратного w
+        int_bits = Conver_Pow2._to_bits(int_part, pin).lstrip('0')
+        int_bits = int_bits.rjust(-(-len(int_bits) // w) * w, '0')
+        result = Conver_Pow2._from_bits(int_bits, pout) or '0'
+
+        # Дробная часть: первые c цифр, дополнение нулями справа
+        frac_bits = Conver_Pow2._to_bits(frac_part, pin)
+        if c > 0 and '1' in frac_bits:
+            frac_bits = frac_bits[:c * w]
+            frac_bits = frac_bits.ljust(-(-len(frac_bits) // w) * w, '0')
+            frac_str = Conver_Pow2._from_bits(frac_bits, pout).rstrip('0')
+            result = f"{result}.{frac_str or '0'}"
+
+        # Знак ставится только перед ненулевым результатом
+        return '-' + result if is_negative and result.strip('0.') else result
@@ -0,0 +1,217 @@
+import math
+from typing import Optional, Protocol
+
+from convers.conver_10_p import Conver_10_P
+from convers.conver_p_10 import Conver_P_10
+from convers.conver_pow2 import Conver_Pow2
+
+
+class ConversionPlan:
+    """
+    План преобразования для фиксированной пары оснований (pin, pout):
+    таблицы цифр и групп цифр, степени основания и коэффициент точности
+    вычисляются один раз при создании плана
+    """
+
+    DIGITS = "0123456789ABCDEF"
+
+    # Готовые планы по тройкам (pin, pout, accuracy)
+    _PLANS = {}
+
+    # Степеней pin^k в таблице плана
+    POWER_CACHE = 64
+
+    def __init__(self, pin: int, pout: int, accuracy: Optional[int] = None):
+        for p in (pin, pout):
+            if p < 2 or p > 16:
+                raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+
+        if accuracy is not None and accuracy < 0:
+            raise ValueError(f"Точность {accuracy} должна быть неотрицательной")
+
+        self._pin = pin
+        self._pout = pout
+        self._accuracy = accuracy
+
+        # Коэффициент для расчета точности: log(Pin) / log(Pout)
+        self._ratio = math.log(pin) / math.log(pout)
+
+        # Таблицы цифр: символ -> значение (для pin), значение -> символ (для pout)
+        self._decode = {}
+        for d, ch in enumerate(self.DIGITS[:pin]):
+            self._decode[ch] = d
+            self._decode[ch.lower()] = d
+        self._encode = self.DIGITS[:pout]
+
+        # Таблицы групп по k цифр: (k, основание^k, таблица)
+        self._chunks_in = Conver_P_10._chunk_table(pin)
+        self._chunks_out = Conver_10_P._chunk_table(pout)
+        self._native_out = Conver_10_P.NATIVE_FORMATS.get(pout)
+
+        # Степени pin^k для коротких дробей (k <= POWER_CACHE) - знаменатели
+        # дробной части; для длинных степень вычисляется при каждом вызове
+        self._pin_powers = tuple(pin ** k for k in range(self.POWER_CACHE + 1))
+
+        self._pow2 = Conver_Pow2.is_applicable(pin, pout)
+
+    @classmethod
+    def for_bases(cls, pin: int, pout: int, accuracy: Optional[int] = None) -> "ConversionPlan":
+        """Получить план из кэша (создается при первом обращении)"""
+        key = (pin, pout, accuracy)
+        plan = cls._PLANS.get(key)
+        if plan is None:
+            plan = cls(pin, pout, accuracy)
+            cls._PLANS[key] = plan
+        return plan
+
+    @property
+    def pin(self) -> int:
+        return self._pin
+
+    @property
+    def pout(self) -> int:
+        return self._pout
+
+    @property
+    def ratio(self) -> float:
+        return self._ratio
+
+    @property
+    def pow2(self) -> bool:
+        """Основания - степени двойки: строка перегруппировывается без разбора"""
+        return self._pow2
+
+    @property
+    def fixed_accuracy(self) -> Optional[int]:
+        """Точность, заданная при создании плана (None - по длине дроби)"""
+        return self._accuracy
+
+    def accuracy(self, frac_len: int) -> int:
+        """Число разрядов дроби в pout для frac_len разрядов в pin"""
+        if self._accuracy is not None:
+            return self._accuracy
+        if frac_len == 0:
+            return 0
+        return max(1, int(round(frac_len * self._ratio + 0.5)))
+
+    def _power(self, k: int) -> int:
+        # Планы хранятся все время работы: таблица степеней не растет с
+        # длиной дроби, иначе память под нее росла бы квадратично
+        if k <= self.POWER_CACHE:
+            return self._pin_powers[k]
+        return self._pin ** k
+
+    def _parse(self, digits: str) -> int:
+        # Длинные строки - рекурсивный разбор движка
+        if len(digits) > Conver_P_10.DC_THRESHOLD_DIGITS:
+            return Conver_P_10._convert_int(digits, self._pin)
+
+        # Допустимые строки - встроенным int()
+        value = Conver_P_10._convert_int_native(digits, self._pin)
+        if value is not None:
+            return value
+
+        # Короткие - по группам из k цифр через таблицу плана
+        k, base, table = self._chunks_in
+        head = len(digits) % k
+        decode = self._decode
+        pin = self._pin
+        value = 0
+        try:
+            for ch in digits[:head]:
+                value = value * pin + decode[ch]
+            for i in range(head, len(digits), k):
+                value = value * base + table[digits[i:i + k]]
+        except KeyError:
+            # Недопустимый символ - поразрядный разбор сообщит, какой
+            return Conver_P_10._convert_int_digits(digits, pin)
+        return value
+
+    def _format_int(self, n: int) -> str:
+        # Длинные числа - рекурсивное деление движка
+        if n.bit_length() > Conver_10_P.DC_THRESHOLD_BITS:
+            return Conver_10_P.int_to_p(n, self._pout)
+
+        # Основания 2, 8, 10, 16 - встроенный format()
+        if self._native_out is not None:
+            return format(n, self._native_out)
+
+        # Короткие - делением на pout^k, k цифр за итерацию
+        k, base, table = self._chunks_out
+        result = []
+        while n >= base:
+            n, chunk = divmod(n, base)
+            result.append(table[chunk])
+        result.append(table[n].lstrip('0') or '0')
+        return ''.join(reversed(result))
+
+    def convert(self, number: str, c: Optional[int] = None) -> str:
+        """
+        Преобразовать строку из pin в pout. Точность c по умолчанию
+        берется из плана или рассчитывается по длине дробной части
+        """
+        if not number:
+            raise ValueError("Пустая строка недопустима")
+
+        # Обработка знака и разделение на целую и дробную части
+        is_negative = number[0] == '-'
+        int_str, delim, frac_str = (number[1:] if is_negative else number).partition('.')
+        if '.' in frac_str:
+            raise ValueError(f"Некорректный формат числа: {number}")
+
+        if c is None:
+            c = self.accuracy(len(frac_str))
+
+        if self._pow2:
+            return Conver_Pow2.do(number, self._pin, self._pout, c)
+
+        return self.convert_value(self._parse(int_str), self._parse(frac_str), len(frac_str), c, is_negative)
+
+    def convert_value(self, int_value: int, numerator: int, frac_len: int,
+                      c: Optional[int] = None, is_negative: bool = False) -> str:
+        """
+        Преобразовать уже разобранное число int_value + numerator / pin^frac_len
+        (например, значение, которое ведет Editor) без разбора строки
+        """
+        if c is None:
+            c = self.accuracy(frac_len)
+
+        result = self._format_int(int_value)
+
+        # Дробная часть: числитель над pin^len, разряды - делением с остатком
+        if numerator > 0 and c > Conver_10_P.PERIOD_THRESHOLD:
+            # Высокая точность: поиск периода, как в Conver_10_P.flt_to_p
+            result = f"{result}.{Conver_10_P._fraction_to_p(numerator, self._power(frac_len), self._pout, c)}"
+        elif numerator > 0 and c > 0:
+            denominator = self._power(frac_len)
+            encode = self._encode
+            pout = self._pout
+            digits = []
+            for _ in range(c):
+                if numerator == 0:
+                    break
+                digit, numerator = divmod(numerator * pout, denominator)
+                digits.append(encode[digit])
+            result = f"{result}.{''.join(digits).rstrip('0') or '0'}"
+
+        # Знак ставится только перед ненулевым результатом
+        return '-' + result if is_negative and result.strip('0.') else result
+
+class RecordSink(Protocol):
+    """Приемник записей преобразований (например, History)"""
+
+    def add_record(self, p1: int, p2: int, n1: str, n2: str) -> None: ...
+
+
+def convert(number: str, pin: int, pout: int, acc: Optional[int] = None,
+            sink: Optional[RecordSink] = None) -> str:
+    """
+    Преобразовать строку number из pin в pout с acc разрядами дроби
+    (None - по длине дробной части, как в Control_). Функция не хранит
+    изменяемого общего состояния и может вызываться из нескольких потоков;
+    запись в историю - только если передан sink
+    """
+    result = ConversionPlan.for_bases(pin, pout).convert(number, acc)
+    if sink is not None:
+        sink.add_record(pin, pout, number, result)
+    return result
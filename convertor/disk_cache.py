@@ -0,0 +1,191 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+
+class DiskCache:
+    """
+    Постоянный кэш результатов преобразования в файле sqlite3 (режим WAL).
+    Ключ - хэш (число, pin, pout, точность); файл можно одновременно
+    читать и изменять из нескольких процессов. При превышении max_size
+    записей удаляются давно не использованные (время использования
+    обновляется не чаще раза в TOUCH_INTERVAL секунд). Новые записи
+    накапливаются в памяти и сохраняются пачками по flush_every записей,
+    а также в flush() и close()
+    """
+
+    TOUCH_INTERVAL = 60   # Секунд между обновлениями времени использования
+    FLUSH_EVERY = 1024    # Новые записи пишутся в файл одной транзакцией на столько
+    MAX_VARIABLES = 500   # Ключей в одном запросе get_many
+    TIMEOUT = 30.0        # Ожидание блокировки другим процессом, секунд
+
+    def __init__(self, path: str, max_size: int = 1_000_000, flush_every: int = FLUSH_EVERY):
+        if max_size < 1:
+            raise ValueError(f"Размер кэша должен быть положительным, получено {max_size}")
+        if flush_every < 1:
+            raise ValueError(f"Размер пачки записей должен быть положительным, получено {flush_every}")
+
+        self._path = path
+        self._max_size = max_size
+        self._flush_every = flush_every
+        self._lock = threading.Lock()
+        self._db = None
+        self._pid = None
+        self._pending = {}
+        self._size = 0      # Оценка числа записей в файле (точно - после пересчета)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @staticmethod
+    def key(number: str, pin: int, pout: int, acc: Optional[int]) -> bytes:
+        return hashlib.blake2b(f"{pin}:{pout}:{acc}:{number}".encode("utf-8"), digest_size=16).digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Соединение sqlite нельзя наследовать при fork - в новом процессе
+        # открывается свое
+        if self._db is None or self._pid != os.getpid():
+            db = sqlite3.connect(self._path, timeout=self.TIMEOUT,
+                                 isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS cache ("
+                       "key BLOB PRIMARY KEY, result TEXT NOT NULL, used REAL NOT NULL"
+                       ") WITHOUT ROWID")
+            db.execute("CREATE INDEX IF NOT EXISTS cache_used ON cache(used)")
+            self._size = db.execute("SELECT count(*) FROM cache").fetchone()[0]
+            self._db = db
+            self._pid = os.getpid()
+        return self._db
+
+    def get(self, number: str, pin: int, pout: int, acc: Optional[int]) -> Optional[str]:
+        """Результат из кэша или None"""
+        key = self.key(number, pin, pout, acc)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._hits += 1
+                return pending[0]
+
+            db = self._connect()
+            row = db.execute("SELECT result, used FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            now = time.time()
+            if now - row[1] >= self.TOUCH_INTERVAL:
+                db.execute("UPDATE cache SET used = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def get_many(self, numbers: List[str], pin: int, pout: int,
+                 accs: List[Optional[int]]) -> List[Optional[str]]:
+        """
+        Результаты для списка чисел (None - нет в кэше): один запрос к файлу
+        на MAX_VARIABLES ключей вместо запроса на каждое число
+        """
+        keys = [self.key(number, pin, pout, acc) for number, acc in zip(numbers, accs)]
+        with self._lock:
+            db = self._connect()
+            found = {}
+            for i in range(0, len(keys), self.MAX_VARIABLES):
+                part = keys[i:i + self.MAX_VARIABLES]
+                found.update((key, (result, used)) for key, result, used in db.execute(
+                    f"SELECT key, result, used FROM cache WHERE key IN ({','.join('?' * len(part))})",
+                    part))
+            found.update(self._pending)
+
+            results = []
+            stale = []
+            now = time.time()
+            for key in keys:
+                row = found.get(key)
+                if row is None:
+                    results.append(None)
+                    continue
+                results.append(row[0])
+                if now - row[1] >= self.TOUCH_INTERVAL:
+                    stale.append((now, key))
+            self._hits += len(keys) - results.count(None)
+            self._misses += results.count(None)
+            if stale:
+                db.executemany("UPDATE cache SET used = ? WHERE key = ?", stale)
+            return results
+
+    def put(self, number: str, pin: int, pout: int, acc: Optional[int], result: str) -> None:
+        key = self.key(number, pin, pout, acc)
+        with self._lock:
+            self._pending[key] = (result, time.time())
+            if len(self._pending) >= self._flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        # Одна транзакция на пачку записей; затем удаляются самые старые
+        # записи сверх max_size
+        if not self._pending:
+            return
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany("INSERT OR REPLACE INTO cache (key, result, used) VALUES (?, ?, ?)",
+                           ((key, result, used) for key, (result, used) in self._pending.items()))
+            # Пересчет записей только при возможном переполнении
+            self._size += len(self._pending)
+            if self._size > self._max_size:
+                self._size = db.execute("SELECT count(*) FROM cache").fetchone()[0]
+                if self._size > self._max_size:
+                    db.execute("DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY used LIMIT ?)",
+                               (self._size - self._max_size,))
+                    self._size = self._max_size
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Сохранить накопленные записи в файл"""
+        with self._lock:
+            self._flush()
+
+    def info(self) -> dict:
+        """Статистика: попадания и промахи этого объекта, записей в файле"""
+        with self._lock:
+            self._flush()
+            size = self._connect().execute("SELECT count(*) FROM cache").fetchone()[0]
+            return {"hits": self._hits, "misses": self._misses, "size": size, "max_size": self._max_size}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._connect().execute("DELETE FROM cache")
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            # Накопленные записи сохраняются, даже если файл еще не открывался
+            self._flush()
+            if self._pid == os.getpid():
+                self._db.close()
+            self._pending.clear()
+            self._db = None
+            self._pid = None
+
+    def __enter__(self) -> "DiskCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
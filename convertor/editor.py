@@ -1,3 +1,15 @@
+from typing import Tuple
+
+from convers.conver_p_10 import Conver_P_10
+
+
+def _allowed_table(p: int) -> dict:
+    # Таблица для str.translate: удаляет допустимые в основании p символы
+    # (цифры в обоих регистрах и разделитель), оставляя недопустимые
+    digits = "0123456789ABCDEF"[:p]
+    return dict.fromkeys(map(ord, digits + digits.lower() + "."))
+
+
 class Editor:
     # Константы
     DELIM = "."  # Разделитель целой и дробной частей
@@ -24,13 +36,54 @@ class Editor:
     CMD_BS = 17       # Забой (удалить последний символ)
     CMD_CLEAR = 18    # Очистить
     
+    DIGITS = "0123456789ABCDEF"
+    
+    TAIL_DIGITS = 16  # Цифр в малом числе до шага Горнера над длинным значением
+    
+    # Байтовые представления символов буфера
+    _DIGIT_BYTES = DIGITS.encode('ascii')
+    _ZERO_BYTES = ZERO.encode('ascii')
+    _DELIM_BYTE = ord(DELIM)
+    
+    # Коды команд редактирования байтами и их символы в буфере
+    _EDIT_COMMANDS = bytes(range(CMD_CLEAR + 1))
+    _DELIM_COMMAND = bytes([CMD_DELIM])
+    _COMMAND_CHARS = bytes.maketrans(bytes(range(CMD_DELIM + 1)), (DIGITS + DELIM).encode('ascii'))
+    
+    # Таблицы для str.translate по основаниям 2..16
+    _ALLOWED = {p: _allowed_table(p) for p in range(2, 17)}
+    
     def __init__(self):
-        self._number = ""  # Поле для хранения редактируемого числа
-        self._has_delim = False  # Флаг наличия разделителя
+        # Редактируемое число хранится в изменяемом буфере ASCII-байтов:
+        # добавление и забой не копируют строку целиком
+        self._buffer = bytearray()
+        self._delim_index = -1   # Позиция разделителя в буфере (-1 - нет)
+        self._text = ""          # Строка буфера (None - буфер изменен)
+        
+        # Точное значение числа, обновляемое при каждой правке:
+        # целая часть, дробная часть как целое и число ее разрядов.
+        # _base - основание, в котором ведется значение (None - не ведется,
+        # будет вычислено заново при запросе)
+        self._base = None
+        self._int_value = 0
+        self._frac_value = 0
+        self._frac_len = 0
+        
+        # Последние цифры текущей части копятся в малом числе _tail и
+        # добавляются к длинному значению раз в TAIL_DIGITS цифр
+        self._tail = 0
+        self._tail_len = 0
     
     @property
     def number(self) -> str:
-        return self._number if self._number else self.ZERO
+        # Строка собирается (одним копированием) только после изменений буфера
+        if self._text is None:
+            self._text = self._buffer.decode('ascii')
+        return self._text if self._text else self.ZERO
+    
+    @property
+    def _has_delim(self) -> bool:
+        return self._delim_index >= 0
     
     def _is_valid_digit(self, n: int, p: int) -> bool:
         return 0 <= n < p
@@ -49,24 +102,35 @@ class Editor:
             # Если цифра недопустима, возвращаем текущее число без изменений
             return self.number
         
+        buffer = self._buffer
+        
         # Проверка на ведущие нули
-        if self._number == self.ZERO and n == 0:
+        if n == 0 and buffer == self._ZERO_BYTES:
             # Не добавляем лишние ведущие нули
             return self.number
         
-        # Если число было пустым и добавляется ноль
-        if not self._number and n == 0:
-            self._number = self.ZERO
-            return self.number
-        
-        # Если число было пустым и добавляется ненулевая цифра
-        if not self._number:
-            self._number = self._digit_to_char(n)
+        # Если число было пустым - значение начинается с этой цифры
+        if not buffer:
+            buffer.append(self._DIGIT_BYTES[n])
+            self._text = None
+            self._reset_value(p)
+            self._int_value = n
             return self.number
         
         # Добавление цифры к существующему числу
-        digit_char = self._digit_to_char(n)
-        self._number += digit_char
+        buffer.append(self._DIGIT_BYTES[n])
+        self._text = None
+        
+        # Схема Горнера: значение * p + n (в дробной части - ее числитель)
+        if self._base == p:
+            self._tail = self._tail * p + n
+            self._tail_len += 1
+            if self._has_delim:
+                self._frac_len += 1
+            if self._tail_len == self.TAIL_DIGITS:
+                self._fold()
+        else:
+            self._base = None
         return self.number
     
     def add_zero(self, p: int = 10) -> str:
@@ -74,41 +138,216 @@ class Editor:
     
     def add_delim(self) -> str:
         # Проверка, что число не пустое
-        if not self._number:
-            self._number = self.ZERO
+        if not self._buffer:
+            self._buffer.append(self._ZERO_BYTES[0])
+            self._text = None
         
         # Проверка, что разделитель еще не добавлен
         if not self._has_delim:
-            self._number += self.DELIM
-            self._has_delim = True
+            # Накопленные цифры относятся к целой части
+            if self._base is not None:
+                self._fold()
+            self._delim_index = len(self._buffer)
+            self._buffer.append(self._DELIM_BYTE)
+            self._text = None
         
         return self.number
     
     def bs(self) -> str:
-        if not self._number:
+        if not self._buffer:
             return self.number
         
-        # Проверка, удаляем ли разделитель
-        if self._number[-1] == self.DELIM:
-            self._has_delim = False
-        
         # Удаление последнего символа
-        self._number = self._number[:-1]
+        removed = self._buffer.pop()
+        self._text = None
+        
+        # Проверка, удаляем ли разделитель
+        if removed == self._DELIM_BYTE:
+            if self._base is not None:
+                self._fold()
+            self._delim_index = -1
+        elif self._base is not None:
+            # Отмена шага Горнера: последняя цифра - остаток от деления на p
+            if self._tail_len == 0:
+                self._unfold()
+            self._tail //= self._base
+            self._tail_len -= 1
+            if self._has_delim:
+                self._frac_len -= 1
         
         return self.number
     
     def clear(self) -> str:
-        self._number = ""
-        self._has_delim = False
+        self._buffer = bytearray()
+        self._delim_index = -1
+        self._text = ""
+        self._reset_value(None)
         return self.number
     
+    def set_number(self, text: str, p: int = 10) -> str:
+        """
+        Заменить число строкой text (вставка) в системе с основанием p.
+        Результат тот же, что при вводе text по одному символу, но строка
+        проверяется за один проход и собирается один раз. При недопустимом
+        символе выбрасывается ValueError, а число не меняется
+        """
+        allowed = self._ALLOWED.get(p)
+        if allowed is None:
+            raise ValueError(f"Основание системы счисления {p} должно быть в диапазоне 2..16")
+        
+        text = text.strip()
+        invalid = text.translate(allowed)
+        if invalid:
+            raise ValueError(f"Недопустимый символ '{invalid[0]}' для основания {p}")
+        if text.count(self.DELIM) > 1:
+            raise ValueError(f"Некорректный формат числа: {text}")
+        
+        text = text.upper()
+        int_str, delim, frac_str = text.partition(self.DELIM)
+        
+        # Ведущие нули схлопываются до одного, как при вводе с клавиатуры
+        stripped = int_str.lstrip(self.ZERO)
+        if len(stripped) < len(int_str) or (delim and not int_str):
+            int_str = self.ZERO + stripped
+        
+        text = int_str + delim + frac_str
+        self._buffer = bytearray(text, 'ascii')
+        self._delim_index = len(int_str) if delim else -1
+        self._text = text
+        # Значение длинного числа вычисляется только при первом запросе
+        self._reset_value(None)
+        return self.number
+    
+    def append_many(self, commands, p: int = 10) -> str:
+        """
+        Выполнить последовательность команд редактирования (как do_edit
+        для каждой), собрав строку числа один раз. Недопустимая команда
+        вызывает ValueError до каких-либо изменений
+        """
+        if not isinstance(commands, (bytes, bytearray)):
+            commands = list(commands)
+            try:
+                data = bytes(commands)
+            except ValueError:
+                data = None
+        else:
+            data = bytes(commands)
+        if data is None or data.translate(None, self._EDIT_COMMANDS):
+            for j in commands:
+                if not 0 <= j <= self.CMD_CLEAR:
+                    raise ValueError(f"Неизвестная команда: {j}")
+        
+        buffer = self._buffer
+        delim_index = self._delim_index
+        digits = self._DIGIT_BYTES
+        zero = self._ZERO_BYTES
+        delim = self._DELIM_BYTE
+        
+        # Поразрядно - все до последнего забоя или очистки, а также пока
+        # число пусто или равно "0" (правило ведущих нулей)
+        last = max(data.rfind(self.CMD_BS), data.rfind(self.CMD_CLEAR))
+        i = 0
+        while i < len(data) and (i <= last or not buffer or buffer == zero):
+            j = data[i]
+            i += 1
+            if j < 16:
+                # Недопустимая цифра и лишний ведущий ноль пропускаются
+                if j >= p or (j == 0 and buffer == zero):
+                    continue
+                buffer.append(digits[j])
+            elif j == self.CMD_DELIM:
+                if not buffer:
+                    buffer.append(zero[0])
+                if delim_index < 0:
+                    delim_index = len(buffer)
+                    buffer.append(delim)
+            elif j == self.CMD_BS:
+                if buffer and buffer.pop() == delim:
+                    delim_index = -1
+            else:
+                buffer.clear()
+                delim_index = -1
+        
+        # Остаток - только цифры и разделители: недопустимые цифры и
+        # повторные разделители удаляются, коды переводятся в символы
+        if i < len(data):
+            rest = data[i:].translate(None, self._invalid_digits(p))
+            delim_command = self._DELIM_COMMAND
+            if delim_index >= 0:
+                rest = rest.replace(delim_command, b'')
+            else:
+                k = rest.find(delim_command)
+                if k >= 0:
+                    delim_index = len(buffer) + k
+                    rest = rest[:k + 1] + rest[k + 1:].replace(delim_command, b'')
+            buffer += rest.translate(self._COMMAND_CHARS)
+        
+        self._delim_index = delim_index
+        self._text = None
+        # Значение будет вычислено заново при первом запросе
+        self._reset_value(None)
+        return self.number
+    
+    @staticmethod
+    def _invalid_digits(p: int) -> bytes:
+        # Коды цифр, недопустимых в основании p
+        return bytes(range(max(p, 0), 16))
+    
+    def _reset_value(self, p) -> None:
+        self._base = p
+        self._int_value = 0
+        self._frac_value = 0
+        self._frac_len = 0
+        self._tail = 0
+        self._tail_len = 0
+    
+    def _fold(self) -> None:
+        # Перенос накопленных цифр в значение текущей части
+        if self._tail_len:
+            scale = self._base ** self._tail_len
+            if self._has_delim:
+                self._frac_value = self._frac_value * scale + self._tail
+            else:
+                self._int_value = self._int_value * scale + self._tail
+            self._tail = 0
+            self._tail_len = 0
+    
+    def _unfold(self) -> None:
+        # Младшие TAIL_DIGITS цифр текущей части - обратно в малое число.
+        # Если цифр меньше, старшая часть равна 0 и значение не меняется
+        scale = self._base ** self.TAIL_DIGITS
+        if self._has_delim:
+            self._frac_value, self._tail = divmod(self._frac_value, scale)
+        else:
+            self._int_value, self._tail = divmod(self._int_value, scale)
+        self._tail_len = self.TAIL_DIGITS
+    
+    def value(self, p: int = 10) -> Tuple[int, int, int]:
+        """
+        Точное значение числа в системе с основанием p:
+        (целая часть, числитель дробной части, число разрядов дроби),
+        т.е. число = целая часть + числитель / p^разрядов.
+        Значение ведется при редактировании, поэтому строка разбирается
+        заново только если цифры вводились в другом основании
+        """
+        if self._base == p:
+            self._fold()
+        else:
+            int_str, _, frac_str = self.number.partition(self.DELIM)
+            int_value = Conver_P_10._convert_int(int_str, p) if int_str else 0
+            frac_value = Conver_P_10._convert_int(frac_str, p) if frac_str else 0
+            self._reset_value(p)
+            self._int_value = int_value
+            self._frac_value = frac_value
+            self._frac_len = len(frac_str)
+        return self._int_value, self._frac_value, self._frac_len
+    
     def acc(self, p_in: int = 10, p_out: int = 10) -> int:
-        if not self._number or self.DELIM not in self._number:
+        if not self._has_delim:
             return 0
         
-        # Получаем дробную часть
-        frac_part = self._number.split(self.DELIM)[1]
-        return len(frac_part)
+        # Длина дробной части - по позиции разделителя
+        return len(self._buffer) - self._delim_index - 1
     
     def do_edit(self, j: int, p: int = 10) -> str:
         if 0 <= j <= 15:  # Команды добавления цифр
@@ -1,25 +1,44 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import time
 from typing import List, Optional
 from dataclasses import dataclass
-from datetime import datetime
 
-@dataclass
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@dataclass(slots=True)
 class Record:
     """
     Структура для хранения одной записи в истории
-    Аналог struct в C#
+    Аналог struct в C#. Время хранится числом секунд от эпохи и
+    форматируется только при выводе записи
     """
     p1: int
     p2: int
     number1: str
     number2: str
-    timestamp: Optional[str] = None
+    time: float
+    
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
     
-    def __init__(self, p1: int, p2: int, n1: str, n2: str):
+    def __init__(self, p1: int, p2: int, n1: str, n2: str, created: Optional[float] = None):
         self.p1 = p1
         self.p2 = p2
         self.number1 = n1
         self.number2 = n2
-        self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.time = time.time() if created is None else created
+    
+    @property
+    def timestamp(self) -> str:
+        return time.strftime(self.TIME_FORMAT, time.localtime(self.time))
     
     def __str__(self) -> str:
         return (f"[{self.timestamp}] "
@@ -32,15 +51,40 @@ class Record:
 
 class History:
     """
-    Класс для хранения истории преобразований чисел
+    Класс для хранения истории преобразований чисел.
+    Добавление записей защищено блокировкой, поэтому историю можно
+    передавать как приемник записей в convert() из нескольких потоков.
+    При заданном max_len хранятся только последние max_len записей:
+    записи лежат в кольцевом буфере, и новая запись замещает самую
+    старую за O(1)
     """
     
-    def __init__(self):
+    def __init__(self, max_len: Optional[int] = None):
+        if max_len is not None and max_len < 1:
+            raise ValueError(f"Длина истории должна быть положительной, получено {max_len}")
+        self._max_len = max_len
         self._records: List[Record] = []
+        self._start = 0     # Индекс самой старой записи в заполненном буфере
+        self._lock = threading.Lock()
+    
+    @property
+    def max_len(self) -> Optional[int]:
+        return self._max_len
     
     def add_record(self, p1: int, p2: int, n1: str, n2: str) -> None:
         record = Record(p1, p2, n1, n2)
-        self._records.append(record)
+        with self._lock:
+            if self._max_len is None or len(self._records) < self._max_len:
+                self._records.append(record)
+            else:
+                self._records[self._start] = record
+                self._start = (self._start + 1) % self._max_len
+    
+    def _slot(self, index: int) -> int:
+        """Позиция в буфере для индекса в порядке добавления (без проверки)"""
+        if self._start:
+            return (self._start + index) % len(self._records)
+        return index
     
     def get_record(self, index: int) -> Optional[Record]:
         """Получить запись по индексу (поддерживает отрицательные индексы)"""
@@ -52,7 +96,7 @@ class History:
             index = len(self._records) + index
         
         if 0 <= index < len(self._records):
-            return self._records[index]
+            return self._records[self._slot(index)]
         return None
     
     def __getitem__(self, index: int) -> Record:
@@ -65,11 +109,13 @@ class History:
             index = len(self._records) + index
         
         if 0 <= index < len(self._records):
-            return self._records[index]
+            return self._records[self._slot(index)]
         raise IndexError(f"Индекс {index} вне диапазона (0-{len(self._records)-1})")
     
     def clear(self) -> None:
-        self._records.clear()
+        with self._lock:
+            self._records.clear()
+            self._start = 0
     
     def count(self) -> int:
         return len(self._records)
@@ -78,22 +124,180 @@ class History:
         return len(self._records)
     
     def get_all_records(self) -> List[Record]:
-        return self._records.copy()
+        with self._lock:
+            return self._records[self._start:] + self._records[:self._start]
     
     def print_history(self) -> None:
-        if not self._records:
+        records = self.get_all_records()
+        if not records:
             print("История пуста")
             return
         
         print("\n" + "=" * 60)
         print("ИСТОРИЯ ПРЕОБРАЗОВАНИЙ")
         print("=" * 60)
-        for i, record in enumerate(self._records):
+        for i, record in enumerate(records):
             print(f"{i+1}. {record}")
         print("=" * 60)
     
     def get_last_record(self) -> Optional[Record]:
         """Получить последнюю запись"""
-        if self._records:
-            return self._records[-1]
-        return None
\ No newline at end of file
+        return self.get_record(-1)
+
+
+class PersistentHistory(History):
+    """
+    История в файле: записи дописываются в журнал path (JSON-lines),
+    а в файл path + ".idx" - смещение и длина каждой записи (INDEX_ENTRY).
+    При открытии журнал не читается: число записей определяется по размеру
+    индекса, а запись по номеру читается одним обращением к файлу по
+    смещению из отображенного в память (mmap) индекса. Новые записи
+    буферизуются и сохраняются в flush(), close() и перед чтением.
+    Писать в историю может только один объект: файл path + ".lock"
+    блокируется при открытии, и второй объект (в этом или другом
+    процессе) получает OSError до close() первого
+    """
+    
+    INDEX_ENTRY = struct.Struct("<QI")  # Смещение записи в журнале, длина в байтах
+    _ENCODER = json.JSONEncoder(ensure_ascii=False)
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self._path = path
+        self._index_path = path + ".idx"
+        self._lock_file = self._acquire(path)
+        self._log = open(path, "ab")
+        self._index = open(self._index_path, "a+b")
+        self._reader = open(path, "rb")
+        self._map = None
+        self._mapped = 0    # Записей в отображении индекса
+        self._dirty = False # Есть несохраненные записи
+        
+        # Конец журнала и число записей - по размерам файлов. Запись,
+        # прерванная при аварийном завершении, отбрасывается
+        self._end = os.fstat(self._log.fileno()).st_size
+        self._count = os.fstat(self._index.fileno()).st_size // self.INDEX_ENTRY.size
+        while self._count and sum(self._entry(self._count - 1)) > self._end:
+            self._count -= 1
+        if self._count * self.INDEX_ENTRY.size != os.fstat(self._index.fileno()).st_size:
+            self._unmap()
+            self._index.truncate(self._count * self.INDEX_ENTRY.size)
+    
+    @property
+    def path(self) -> str:
+        return self._path
+    
+    @staticmethod
+    def _acquire(path: str):
+        # Смещения новых записей берутся из _end, прочитанного при открытии,
+        # поэтому второй пишущий объект испортил бы индекс
+        lock_file = open(path + ".lock", "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise OSError(f"История {path} уже открыта для записи")
+        return lock_file
+    
+    def _entry(self, index: int) -> tuple:
+        """(смещение, длина) записи index из индекса"""
+        if index >= self._mapped:
+            self._flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._index.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped = len(self._map) // self.INDEX_ENTRY.size
+        return self.INDEX_ENTRY.unpack_from(self._map, index * self.INDEX_ENTRY.size)
+    
+    def _read(self, index: int) -> Record:
+        offset, length = self._entry(index)
+        if self._dirty:
+            self._flush()
+        self._reader.seek(offset)
+        data = json.loads(self._reader.read(length))
+        return Record(data["p1"], data["p2"], data["number1"], data["number2"], data["time"])
+    
+    def add_record(self, p1: int, p2: int, n1: str, n2: str) -> None:
+        record = Record(p1, p2, n1, n2)
+        line = self._ENCODER.encode({"p1": p1, "p2": p2, "number1": n1, "number2": n2,
+                                     "time": record.time}).encode("utf-8") + b"\n"
+        with self._lock:
+            self._log.write(line)
+            self._index.write(self.INDEX_ENTRY.pack(self._end, len(line)))
+            self._end += len(line)
+            self._count += 1
+            self._dirty = True
+    
+    def get_record(self, index: int) -> Optional[Record]:
+        """Получить запись по индексу (поддерживает отрицательные индексы)"""
+        with self._lock:
+            if index < 0:
+                index = self._count + index
+            if 0 <= index < self._count:
+                return self._read(index)
+            return None
+    
+    def __getitem__(self, index: int) -> Record:
+        """Перегрузка [] для доступа по индексу (поддерживает отрицательные индексы)"""
+        with self._lock:
+            if not self._count:
+                raise IndexError("История пуста")
+            if index < 0:
+                index = self._count + index
+            if 0 <= index < self._count:
+                return self._read(index)
+            raise IndexError(f"Индекс {index} вне диапазона (0-{self._count-1})")
+    
+    def _flush(self) -> None:
+        # Сначала журнал, затем индекс: индекс не ссылается на несохраненные данные
+        self._log.flush()
+        self._index.flush()
+        self._dirty = False
+    
+    def flush(self) -> None:
+        """Сохранить накопленные записи в файлы"""
+        with self._lock:
+            self._flush()
+    
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._mapped = 0
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._flush()
+            self._unmap()
+            self._log.truncate(0)
+            self._index.truncate(0)
+            self._end = 0
+            self._count = 0
+    
+    def count(self) -> int:
+        return self._count
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def get_all_records(self) -> List[Record]:
+        with self._lock:
+            return [self._read(i) for i in range(self._count)]
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._log.closed:
+                return
+            self._flush()
+            self._unmap()
+            for f in (self._log, self._index, self._reader, self._lock_file):
+                f.close()
+    
+    def __enter__(self) -> "PersistentHistory":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
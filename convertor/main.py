@@ -9,7 +9,7 @@ from PyQt5.QtWidgets import (
     QMenu, QAction, QMessageBox, QTextEdit, QDialog, QFrame, QGroupBox
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QKeyEvent, QPalette, QColor
+from PyQt5.QtGui import QFont, QKeyEvent, QKeySequence, QPalette, QColor
 
 from control import Control_, State
 from history import History
@@ -561,7 +561,22 @@ class MainWindow(QMainWindow):
     
     # === Обработчики клавиатуры ===
     
+    def paste_number(self):
+        """Вставка числа из буфера обмена целиком"""
+        try:
+            result = self.ctl.set_number(QApplication.clipboard().text())
+        except ValueError as e:
+            self.status_label.setText(f"Ошибка вставки: {e}")
+            return
+        self.input_label.setText(result)
+        self.result_label.setText("0")
+        self.status_label.setText(f"Вставлено разрядов: {len(result)}")
+    
     def keyPressEvent(self, event: QKeyEvent):
+        if event.matches(QKeySequence.Paste):
+            self.paste_number()
+            return
+        
         text = event.text()
         
         if text:
@@ -0,0 +1,208 @@
+"""
+Сервер преобразования чисел (asyncio, протокол JSON-lines).
+
+Каждая строка запроса - JSON-объект {"number", "pin", "pout", "acc"}
+(необязательное поле "id" возвращается в ответе без изменений); каждая
+строка ответа - {"id", "result"} или {"id", "error"}:
+
+    python -m convertor.server --port 8765
+    python -m convertor.server --unix /tmp/convertor.sock
+
+Точность acc - не больше MAX_ACC разрядов.
+
+Запросы одного соединения можно отправлять не дожидаясь ответов:
+ответы приходят в порядке запросов. Одновременно в работе не более
+--limit запросов на соединение, после чего сервер перестает читать
+сокет до освобождения места. Длинные числа преобразуются в пуле
+процессов, чтобы цикл событий не простаивал
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from control import Control_
+from convers.conversion_plan import ConversionPlan, convert
+
+LIMIT = 64           # Запросов в работе на одно соединение
+INLINE_DIGITS = 256  # Числа короче преобразуются прямо в цикле событий
+LINE_LIMIT = 1 << 24 # Наибольшая длина строки запроса в байтах
+MAX_ACC = 1 << 20    # Наибольшая точность (разрядов дроби) в запросе
+
+
+def convert_request(number: str, pin: int, pout: int, acc: Optional[int]) -> str:
+    """Преобразование одного запроса (выполняется и в процессах пула)"""
+    return convert(number, pin, pout, acc)
+
+
+class Connection:
+    """
+    Состояние одного соединения: очередь ответов в порядке запросов.
+    Соединения не разделяют ни редактор, ни историю
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 executor: Optional[Executor], limit: int):
+        self._reader = reader
+        self._writer = writer
+        self._executor = executor
+        # Очередь ограничена: при заполнении чтение сокета приостанавливается
+        self._pending = asyncio.Queue(maxsize=limit)
+
+    @staticmethod
+    def _parse(request) -> tuple:
+        if not isinstance(request, dict):
+            raise ValueError("Запрос должен быть JSON-объектом")
+
+        number = request.get("number")
+        if not isinstance(number, str):
+            raise ValueError("Поле number должно быть строкой")
+        pin = request.get("pin", Control_.DEFAULT_PIN)
+        pout = request.get("pout", Control_.DEFAULT_POUT)
+        acc = request.get("acc")
+        for name, value in (("pin", pin), ("pout", pout), ("acc", acc)):
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+                raise ValueError(f"Поле {name} должно быть целым числом")
+        if pin is None or pout is None:
+            raise ValueError("Поля pin и pout должны быть целыми числами")
+
+        # Основания и точность проверяются сразу, до постановки в пул.
+        # План кэшируется только по паре оснований: точность задает клиент,
+        # и план на каждое ее значение занимал бы память без ограничения
+        ConversionPlan.for_bases(pin, pout)
+        if acc is not None and acc < 0:
+            raise ValueError(f"Точность {acc} должна быть неотрицательной")
+        if acc is not None and acc > MAX_ACC:
+            raise ValueError(f"Точность {acc} больше допустимой ({MAX_ACC})")
+        return number.strip(), pin, pout, acc
+
+    def _submit(self, line: bytes) -> Tuple[object, asyncio.Future]:
+        """Разобрать запрос и начать преобразование; возвращает (id, future)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request_id = None
+        try:
+            request = json.loads(line)
+            if isinstance(request, dict):
+                request_id = request.get("id")
+            number, pin, pout, acc = self._parse(request)
+            heavy = len(number) > INLINE_DIGITS or (acc or 0) > INLINE_DIGITS
+            if self._executor is None or not heavy:
+                future.set_result(convert_request(number, pin, pout, acc))
+            else:
+                future = loop.run_in_executor(self._executor, convert_request, number, pin, pout, acc)
+        except Exception as e:
+            # Любая ошибка запроса - ответ с полем error, соединение остается
+            future.set_exception(e)
+        return request_id, future
+
+    async def _write_responses(self) -> None:
+        connected = True
+        while True:
+            item = await self._pending.get()
+            if item is None:
+                break
+            request_id, future = item
+            try:
+                response = {"id": request_id, "result": await future}
+            except Exception as e:
+                response = {"id": request_id, "error": str(e)}
+            if not connected:
+                # Клиент отключился: ответы отбрасываются, чтобы чтение не ждало места
+                continue
+            try:
+                self._writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                # Медленный клиент: ждем опустошения буфера сокета
+                await self._writer.drain()
+            except ConnectionError:
+                connected = False
+
+    async def serve(self) -> None:
+        writer_task = asyncio.create_task(self._write_responses())
+        try:
+            while True:
+                try:
+                    line = await self._reader.readline()
+                except (ValueError, ConnectionError):
+                    # Слишком длинная строка или разрыв соединения
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    await self._pending.put(self._submit(line))
+            await self._pending.put(None)
+            await writer_task
+        finally:
+            writer_task.cancel()
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def start_server(host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None,
+                       executor: Optional[Executor] = None, limit: int = LIMIT) -> asyncio.AbstractServer:
+    """
+    Запустить сервер на TCP-порту или Unix-сокете path. executor - пул для
+    длинных чисел (None - все преобразования в цикле событий)
+    """
+    if limit < 1:
+        raise ValueError(f"Число запросов в работе должно быть положительным, получено {limit}")
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await Connection(reader, writer, executor, limit).serve()
+        except asyncio.CancelledError:
+            # Остановка цикла событий при открытом соединении
+            pass
+
+    if path is not None:
+        return await asyncio.start_unix_server(handle, path=path, limit=LINE_LIMIT)
+    return await asyncio.start_server(handle, host, port, limit=LINE_LIMIT)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m convertor.server",
+        description="Сервер преобразования чисел (JSON-lines по TCP или Unix-сокету)")
+    parser.add_argument("--host", default="127.0.0.1", help="адрес TCP (по умолчанию 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="порт TCP (по умолчанию 8765)")
+    parser.add_argument("--unix", default=None, help="путь Unix-сокета вместо TCP")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="число процессов для длинных чисел (0 - без пула)")
+    parser.add_argument("--limit", type=int, default=LIMIT,
+                        help=f"запросов в работе на одно соединение (по умолчанию {LIMIT})")
+    return parser
+
+
+async def serve_forever(args: argparse.Namespace) -> None:
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 0 else None
+    try:
+        server = await start_server(args.host, args.port, args.unix, executor, args.limit)
+        async with server:
+            await server.serve_forever()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.limit < 1:
+        print(f"Ошибка: --limit должен быть положительным, получено {args.limit}", file=sys.stderr)
+        return 2
+    try:
+        asyncio.run(serve_forever(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
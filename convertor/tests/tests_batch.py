@@ -0,0 +1,94 @@
+import sys
+import os
+import io
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+sys.set_int_max_str_digits(0)
+
+import batch
+from disk_cache import DiskCache
+
+
+def run_batch(argv, text):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = batch.main(argv, stdin=io.StringIO(text), stdout=stdout, stderr=stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def quick_test():
+    """Быстрый тест пакетного преобразования"""
+    print("БЫСТРЫЙ ТЕСТ ПАКЕТНОГО ПРЕОБРАЗОВАНИЯ")
+    print("=" * 50)
+
+    code, out, err = run_batch(["--pin", "16", "--pout", "2", "--acc", "8"], "FF\n1A.8\n\n  -0.1 \n")
+    code_bad, out_bad, err_bad = run_batch(["--pin", "10", "--pout", "16"], "10.5\nZZ\n255\n")
+    code_base, _, err_base = run_batch(["--pin", "1"], "")
+
+    text = "".join(f"{i}.{i % 7}\n" for i in range(1, 200)) + "1G\n5"
+    code_seq, out_seq, err_seq = run_batch(["--pin", "16", "--pout", "10"], text)
+    code_par, out_par, err_par = run_batch(["--pin", "16", "--pout", "10", "--workers", "2",
+                                            "--chunk-lines", "16"], text)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "number.txt")
+        dst = os.path.join(tmp, "result.txt")
+        with open(src, "w") as f:
+            f.write("-" + "F" * 3000 + ".8\n")
+        code_single, _, _ = run_batch(["--single", "--pin", "16", "--pout", "10", src, "-o", dst], "")
+        with open(dst) as f:
+            out_single = f.read()
+        code_no_out, _, _ = run_batch(["--single", src], "")
+
+        cache = os.path.join(tmp, "cache.db")
+        cached_runs = [run_batch(["--pin", "16", "--pout", "10", "--cache", cache] + extra, text)
+                       for extra in ([], [], ["--workers", "2", "--chunk-lines", "16"])]
+
+        # Процессы пула сохраняют в кэш все свои записи
+        parallel_cache = os.path.join(tmp, "parallel.db")
+        run_batch(["--pin", "10", "--pout", "2", "--workers", "2", "--cache", parallel_cache],
+                  "".join(f"{i}\n" for i in range(3000)))
+        with DiskCache(parallel_cache) as c:
+            parallel_stored = c.info()["size"]
+
+    tests = [
+        ("16 -> 2, acc=8: результат", out, "11111111\n11010.1\n\n-0.0001\n"),
+        ("16 -> 2, acc=8: код возврата", code, 0),
+        ("10 -> 16: ошибочная строка не меняется", out_bad, "A.8\nZZ\nFF\n"),
+        ("10 -> 16: номер ошибочной строки", "строка 2" in err_bad, True),
+        ("10 -> 16: код возврата при ошибке", code_bad, 1),
+        ("pin=1: код возврата", code_base, 2),
+        ("pin=1: сообщение об ошибке", bool(err_base), True),
+        ("--workers 2: тот же результат и порядок", out_par, out_seq),
+        ("--workers 2: те же ошибки", (code_par, err_par), (code_seq, err_seq)),
+        ("--workers 2: номер ошибочной строки", "строка 200:" in err_par, True),
+        ("--single: результат", (code_single, out_single), (0, f"-{16 ** 3000 - 1}.5")),
+        ("--single без --output: код возврата", code_no_out, 2),
+        ("--cache: те же результаты и ошибки при всех прогонах",
+         cached_runs, [(code_seq, out_seq, err_seq)] * 3),
+        ("--cache --workers 2: сохранены все 3000 результатов", parallel_stored, 3000),
+    ]
+
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name}")
+        else:
+            print(f"✗ {name} = {result!r} (ожидалось {expected!r})")
+            all_passed = False
+
+    return all_passed
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ МОДУЛЯ batch")
+    print("=" * 70)
+
+    quick_passed = quick_test()
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed else 1)
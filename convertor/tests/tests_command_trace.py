@@ -0,0 +1,81 @@
+import sys
+import os
+import io
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from control import Control_
+from command_trace import encode_trace, write_trace, read_traces, replay
+
+
+def quick_test():
+    """Быстрый тест записи и воспроизведения трасс"""
+    print("БЫСТРЫЙ ТЕСТ ТРАСС КОМАНД")
+    print("=" * 50)
+
+    rnd = random.Random(230)
+    sessions = []
+    for _ in range(200):
+        pin = rnd.randint(2, 16)
+        commands = [rnd.choice([rnd.randrange(pin)] * 6 + [16, 17, 18, Control_.CMD_EXECUTE])
+                    for _ in range(rnd.randint(0, 30))]
+        sessions.append((pin, rnd.randint(2, 16), commands))
+
+    stream = io.BytesIO()
+    for session in sessions:
+        write_trace(stream, *session)
+    size = stream.tell()
+
+    stream.seek(0)
+    decoded = [(pin, pout, list(commands)) for pin, pout, commands in read_traces(stream)]
+
+    expected = []
+    for pin, pout, commands in sessions:
+        control = Control_()
+        control.pin, control.pout = pin, pout
+        results = [(cmd, control.do_command(cmd)) for cmd in commands]
+        expected.append([result for cmd, result in results if cmd == Control_.CMD_EXECUTE])
+    stream.seek(0)
+    replayed = list(replay(stream))
+
+    tests = [
+        ("encode_trace(10, 16, [1, 0, 19])", encode_trace(10, 16, [1, 0, 19]), b"CVT1\x0a\x10\x03\x00\x00\x00\x01\x00\x13"),
+        ("размер: 10 байт заголовка + байт на команду",
+         size, sum(10 + len(commands) for _, _, commands in sessions)),
+        ("read_traces возвращает записанное", decoded, sessions),
+        ("replay - результаты выполнения", replayed, expected),
+    ]
+
+    all_passed = True
+    for name, result, expected_result in tests:
+        if result == expected_result:
+            print(f"✓ {name}")
+        else:
+            print(f"✗ {name} = {result!r} (ожидалось {expected_result!r})")
+            all_passed = False
+
+    for name, action in [("команда 20", lambda: encode_trace(10, 16, [1, 20])),
+                         ("основание 17", lambda: encode_trace(17, 16, [1])),
+                         ("неверная сигнатура", lambda: list(read_traces(io.BytesIO(b"XXXX\x0a\x10\x00\x00\x00\x00")))),
+                         ("обрезанная трасса", lambda: list(read_traces(io.BytesIO(encode_trace(10, 16, [1, 2])[:-1]))))]:
+        try:
+            action()
+            print(f"✗ {name} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            print(f"✓ {name} - корректно вызвано исключение")
+
+    return all_passed
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ МОДУЛЯ command_trace")
+    print("=" * 70)
+
+    quick_passed = quick_test()
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed else 1)
@@ -1,12 +1,15 @@
 import sys
 import os
 import math
+import random
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from control import State, Control_
 from editor import Editor
 from history import History
+from convers.conversion_plan import convert
+from convers.conver_pow2 import Conver_Pow2
 
 class StructuralTester:
     """
@@ -80,6 +83,31 @@ class StructuralTester:
                      c.do_command(16) and c.do_command(5) and 
                      c.do_command(19) and 
                      c.get_last_record() != "История пуста")(Control_()), True),
+            
+            # Тест кэша результатов: попадание пишется в историю
+            ("cache_info() - попадание", 
+             lambda: (lambda c: 
+                     c.do_command(1) and c.do_command(19) == "1" and 
+                     c.do_command(19) == "1" and 
+                     c.cache_info()["hits"] == 1 and 
+                     c.cache_info()["misses"] == 1 and 
+                     c.history.count() == 2)(Control_(cache_size=4)), True),
+            
+            # Тест convert_all: совпадение с do_command для каждого основания
+            ("convert_all()", 
+             lambda: (lambda c: 
+                     c.do_command(1) and c.do_command(0) and 
+                     c.do_command(16) and c.do_command(5) and 
+                     all(c.convert_all()[p] == (setattr(c, 'pout', p) or c.do_command(19)) 
+                         for p in range(2, 17)))(Control_()), True),
+            
+            # Тест кэша результатов: вытеснение
+            ("cache_info() - вытеснение", 
+             lambda: (lambda c: 
+                     c.do_command(1) and c.do_command(19) and 
+                     c.do_command(2) and c.do_command(19) and 
+                     c.cache_info()["evictions"] == 1 and 
+                     c.cache_info()["size"] == 1)(Control_(cache_size=1)), True),
         ]
         
         passed = 0
@@ -338,6 +366,114 @@ def quick_test():
     return True
 
 
+def random_edit_test(count: int = 300):
+    """
+    Случайные последовательности правок: значение, которое ведет редактор,
+    и результат выполнения совпадают с разбором строки заново
+    """
+    print("\nСЛУЧАЙНЫЕ ПОСЛЕДОВАТЕЛЬНОСТИ ПРАВОК")
+    print("=" * 50)
+    
+    rnd = random.Random(20)
+    for _ in range(count):
+        control = Control_()
+        control.pin = rnd.randint(2, 16)
+        control.pout = rnd.randint(2, 16)
+        commands = []
+        for _ in range(rnd.randint(1, 60)):
+            cmd = rnd.choice([rnd.randrange(control.pin)] * 6 + [Editor.CMD_DELIM, Editor.CMD_BS, Editor.CMD_CLEAR])
+            commands.append(cmd)
+            control.do_command(cmd)
+            
+            number = control.editor.number
+            int_str, _, frac_str = number.partition('.')
+            expected_value = (int(int_str or '0', control.pin), int(frac_str or '0', control.pin), len(frac_str))
+            if control.editor.value(control.pin) != expected_value:
+                print(f"✗ value('{number}', {control.pin}) = {control.editor.value(control.pin)} "
+                      f"(ожидалось {expected_value})")
+                return False
+        
+        number = control.editor.number
+        bulk = (Editor().append_many(commands, control.pin), Editor().set_number(number, control.pin))
+        if bulk != (number, number):
+            print(f"✗ append_many/set_number: {bulk} (ожидалось '{number}')")
+            return False
+        
+        result = control.do_command(Control_.CMD_EXECUTE)
+        expected = "0" if number == "0" else convert(number, control.pin, control.pout,
+                                                     control._calculate_accuracy())
+        if result != expected:
+            print(f"✗ ({control.pin}->{control.pout}) '{number}' = '{result}' (ожидалось '{expected}')")
+            return False
+    
+    print(f"✓ {count} последовательностей правок совпали с разбором строки")
+    return True
+
+
+def pow2_dispatch_test():
+    """Основания - степени двойки: EXECUTE идет через Conver_Pow2"""
+    print("\nПРЕОБРАЗОВАНИЕ МЕЖДУ СТЕПЕНЯМИ ДВОЙКИ")
+    print("=" * 50)
+    
+    number = "1." + "0" * 80000
+    calls = []
+    do = Conver_Pow2.do
+    Conver_Pow2.do = staticmethod(lambda *args: calls.append(args) or do(*args))
+    try:
+        c = Control_()
+        c.pin, c.pout = 2, 16
+        c.set_number(number)
+        result = c.do_command(Control_.CMD_EXECUTE)
+    finally:
+        Conver_Pow2.do = staticmethod(do)
+    
+    expected = do(number, 2, 16, 20000)
+    if len(calls) == 1 and result == expected:
+        print("✓ 2 -> 16: Control_ использует Conver_Pow2")
+        return True
+    print(f"✗ 2 -> 16: вызовов Conver_Pow2.do {len(calls)}, результат {result[:20]}...")
+    return False
+
+
+def run_test(count: int = 500):
+    """run() дает те же результаты, число, состояние и историю, что do_command"""
+    print("\nВЫПОЛНЕНИЕ ПОТОКА КОМАНД run()")
+    print("=" * 50)
+    
+    rnd = random.Random(23)
+    for _ in range(count):
+        pin = rnd.randint(2, 16)
+        pout = rnd.randint(2, 16)
+        commands = [rnd.choice([rnd.randrange(16)] * 8 + [Editor.CMD_DELIM, Editor.CMD_BS,
+                                                          Editor.CMD_CLEAR, Control_.CMD_EXECUTE])
+                    for _ in range(rnd.randint(0, 40))]
+        outputs = rnd.choice([(Control_.CMD_EXECUTE,), None, (Editor.CMD_DELIM, Control_.CMD_EXECUTE), ()])
+        
+        expected = Control_()
+        expected.pin, expected.pout = pin, pout
+        expected_results = [r for cmd in commands for r in [expected.do_command(cmd)]
+                            if outputs is None or cmd in outputs]
+        
+        for stream in (commands, bytes(commands)):
+            control = Control_()
+            control.pin, control.pout = pin, pout
+            results = control.run(stream, outputs)
+            state = (results, control.editor.number, control.state, len(control.history))
+            if state != (expected_results, expected.editor.number, expected.state, len(expected.history)):
+                print(f"✗ run({commands}, {outputs}) = {state}")
+                return False
+    
+    try:
+        Control_().run([1, 2, 99])
+        print("✗ run() с неизвестной командой - исключение не вызвано")
+        return False
+    except ValueError:
+        pass
+    
+    print(f"✓ {count} потоков команд совпали с do_command")
+    return True
+
+
 def demo():
     """Демонстрация работы класса Control_"""
     print("\n" + "=" * 60)
@@ -386,7 +522,7 @@ if __name__ == "__main__":
     print("=" * 70)
     
     print("\n1. Быстрый тест основных функций:")
-    quick_passed = quick_test()
+    quick_passed = quick_test() and random_edit_test() and run_test() and pow2_dispatch_test()
     
     if quick_passed:
         print("\n✓ Быстрый тест пройден успешно!")
@@ -0,0 +1,105 @@
+import sys
+import os
+import random
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from convers.conver_file import Conver_File
+from convers.conversion_plan import ConversionPlan
+
+
+def convert_text(tmp: str, text: str, pin: int, pout: int, c=None) -> str:
+    src = os.path.join(tmp, "number.txt")
+    dst = os.path.join(tmp, "result.txt")
+    with open(src, "w") as f:
+        f.write(text)
+    Conver_File.do(src, dst, pin, pout, c)
+    with open(dst) as f:
+        return f.read()
+
+
+def quick_test(tmp: str):
+    """Быстрый тест основных функций"""
+    print("БЫСТРЫЙ ТЕСТ ОСНОВНЫХ ФУНКЦИЙ")
+    print("=" * 50)
+
+    tests = [
+        ("10 -> 16: '255'", convert_text(tmp, "255\n", 10, 16), 'FF'),
+        ("10 -> 16: '10.5'", convert_text(tmp, "10.5", 10, 16), 'A.8'),
+        ("10 -> 16: '-17.875'", convert_text(tmp, " -17.875 ", 10, 16), '-11.E'),
+        ("10 -> 16: '-0.001', c=1", convert_text(tmp, "-0.001", 10, 16, 1), '0.0'),
+        ("10 -> 3: '0.5'", convert_text(tmp, "0.5", 10, 3), '0.111'),
+        ("16 -> 2: 'A.8'", convert_text(tmp, "A.8", 16, 2), '1010.1'),
+        ("2 -> 10: '0'", convert_text(tmp, "0", 2, 10), '0'),
+    ]
+
+    # Больше 4300 десятичных цифр - предела встроенного str()/format()
+    for name, number in [("16 -> 10: 'F'*5000", 'F' * 5000), ("16 -> 10: '0.'+'F'*5000", '0.' + 'F' * 5000)]:
+        result = convert_text(tmp, number, 16, 10)
+        tests.append((name, len(result) > 4300 and result == ConversionPlan(16, 10).convert(number), True))
+
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name:40} = '{result}'")
+        else:
+            print(f"✗ {name:40} = '{result}' (ожидалось '{expected}')")
+            all_passed = False
+
+    for name, text in [("пустой файл", ""), ("только пробелы", " \n"),
+                       ("'1.2.3'", "1.2.3"), ("'1A' при pin=10", "1A")]:
+        try:
+            convert_text(tmp, text, 10, 16)
+            print(f"✗ {name:40} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            print(f"✓ {name:40} - корректно вызвано исключение")
+
+    return all_passed
+
+
+def cross_test(tmp: str, count: int = 300):
+    """Сравнение с ConversionPlan при малых размерах частей"""
+    print("\nСРАВНЕНИЕ С ConversionPlan")
+    print("=" * 50)
+
+    leaf_digits, leaf_bits = Conver_File.LEAF_DIGITS, Conver_File.LEAF_BITS
+    Conver_File.LEAF_DIGITS, Conver_File.LEAF_BITS = 4, 8
+    try:
+        rnd = random.Random(16)
+        digits = "0123456789ABCDEF"
+        for _ in range(count):
+            pin = rnd.randint(2, 16)
+            pout = rnd.randint(2, 16)
+            number = '-' * rnd.randint(0, 1)
+            number += ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(1, 40)))
+            if rnd.random() < 0.7:
+                number += '.' + ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(0, 30)))
+            c = rnd.choice([None, rnd.randint(0, 40)])
+
+            expected = ConversionPlan.for_bases(pin, pout).convert(number, c)
+            result = convert_text(tmp, number, pin, pout, c)
+            if result != expected:
+                print(f"✗ ({pin}->{pout}) '{number}', c={c}: '{result}' (ожидалось '{expected}')")
+                return False
+    finally:
+        Conver_File.LEAF_DIGITS, Conver_File.LEAF_BITS = leaf_digits, leaf_bits
+
+    print(f"✓ {count} случайных чисел совпали")
+    return True
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ КЛАССА Conver_File")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        quick_passed = quick_test(tmp)
+        cross_passed = cross_test(tmp)
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+    print(f"Сравнение с ConversionPlan: {'ПРОЙДЕН ✓' if cross_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed and cross_passed else 1)
@@ -0,0 +1,87 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from convers.conver_pow2 import Conver_Pow2
+from convers.conver_10_p import Conver_10_P
+from convers.conver_p_10 import Conver_P_10
+
+
+def quick_test():
+    """Быстрый тест основных функций"""
+    print("БЫСТРЫЙ ТЕСТ ОСНОВНЫХ ФУНКЦИЙ")
+    print("=" * 50)
+
+    tests = [
+        ("is_applicable(2, 16)", Conver_Pow2.is_applicable(2, 16), True),
+        ("is_applicable(10, 16)", Conver_Pow2.is_applicable(10, 16), False),
+
+        ("do('FF', 16, 2, 0)", Conver_Pow2.do('FF', 16, 2, 0), '11111111'),
+        ("do('101', 2, 16, 0)", Conver_Pow2.do('101', 2, 16, 0), '5'),
+        ("do('A5.E', 16, 8, 4)", Conver_Pow2.do('A5.E', 16, 8, 4), '245.7'),
+        ("do('-1.1', 2, 16, 1)", Conver_Pow2.do('-1.1', 2, 16, 1), '-1.8'),
+        ("do('0.0001', 2, 16, 1)", Conver_Pow2.do('0.0001', 2, 16, 1), '0.1'),
+        ("do('0.00001', 2, 16, 1)", Conver_Pow2.do('0.00001', 2, 16, 1), '0.0'),
+        ("do('10.000', 2, 4, 2)", Conver_Pow2.do('10.000', 2, 4, 2), '2'),
+        ("do('.f', 16, 4, 2)", Conver_Pow2.do('.f', 16, 4, 2), '0.33'),
+    ]
+
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name:30} = '{result}'")
+        else:
+            print(f"✗ {name:30} = '{result}' (ожидалось '{expected}')")
+            all_passed = False
+
+    for name, args in [("do('12', 2, 16, 0)", ('12', 2, 16, 0)),
+                       ("do('1', 10, 16, 0)", ('1', 10, 16, 0)),
+                       ("do('1.1.1', 2, 16, 0)", ('1.1.1', 2, 16, 0))]:
+        try:
+            Conver_Pow2.do(*args)
+            print(f"✗ {name:30} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            print(f"✓ {name:30} - корректно вызвано исключение")
+
+    return all_passed
+
+
+def cross_test(count: int = 2000):
+    """Сравнение с преобразованием через точное значение"""
+    print("\nСРАВНЕНИЕ С ОБЩИМ ПУТЕМ ПРЕОБРАЗОВАНИЯ")
+    print("=" * 50)
+
+    rnd = random.Random(7)
+    digits = "0123456789ABCDEF"
+    for _ in range(count):
+        pin = rnd.choice([2, 4, 8, 16])
+        pout = rnd.choice([2, 4, 8, 16])
+        number = ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(1, 8)))
+        number += '.' + ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(0, 8)))
+        c = rnd.randint(0, 10)
+
+        expected = Conver_10_P.do(Conver_P_10.dval_exact(number, pin), pout, c)
+        result = Conver_Pow2.do(number, pin, pout, c)
+        if result != expected:
+            print(f"✗ do('{number}', {pin}, {pout}, {c}) = '{result}' (ожидалось '{expected}')")
+            return False
+
+    print(f"✓ {count} случайных чисел совпали")
+    return True
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ КЛАССА Conver_Pow2")
+    print("=" * 70)
+
+    quick_passed = quick_test()
+    cross_passed = cross_test()
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+    print(f"Сравнение с общим путем: {'ПРОЙДЕН ✓' if cross_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed and cross_passed else 1)
@@ -0,0 +1,179 @@
+import sys
+import os
+import random
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from convers.conversion_plan import ConversionPlan, convert
+from convers.conver_10_p import Conver_10_P
+from convers.conver_p_10 import Conver_P_10
+from history import History
+
+
+def quick_test():
+    """Быстрый тест основных функций"""
+    print("БЫСТРЫЙ ТЕСТ ОСНОВНЫХ ФУНКЦИЙ")
+    print("=" * 50)
+
+    plan = ConversionPlan(10, 16)
+    tests = [
+        ("for_bases(10, 16) кэшируется",
+         ConversionPlan.for_bases(10, 16) is ConversionPlan.for_bases(10, 16), True),
+        ("accuracy(0)", plan.accuracy(0), 0),
+        ("accuracy(1)", plan.accuracy(1), 1),
+        ("accuracy(10)", plan.accuracy(10), 9),
+        ("ConversionPlan(10, 16, 3).accuracy(10)", ConversionPlan(10, 16, 3).accuracy(10), 3),
+
+        ("convert('10.5')", plan.convert('10.5'), 'A.8'),
+        ("convert('-17.875')", plan.convert('-17.875'), '-11.E'),
+        ("convert('255')", plan.convert('255'), 'FF'),
+        ("convert('0.1', 2)", plan.convert('0.1', 2), '0.19'),
+        ("convert('-0.001', 1)", plan.convert('-0.001', 1), '0.0'),
+        ("ConversionPlan(16, 2).convert('A.8')", ConversionPlan(16, 2).convert('A.8'), '1010.1'),
+        ("ConversionPlan(10, 3).convert('0.5')", ConversionPlan(10, 3).convert('0.5'), '0.111'),
+        ("convert('10.5', 10, 16)", convert('10.5', 10, 16), 'A.8'),
+        ("convert('0.1', 10, 2, 4)", convert('0.1', 10, 2, 4), '0.0001'),
+    ]
+
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name:40} = '{result}'")
+        else:
+            print(f"✗ {name:40} = '{result}' (ожидалось '{expected}')")
+            all_passed = False
+
+    for name, args in [("ConversionPlan(1, 10)", (1, 10)),
+                       ("ConversionPlan(10, 17)", (10, 17)),
+                       ("ConversionPlan(10, 2, -1)", (10, 2, -1))]:
+        try:
+            ConversionPlan(*args)
+            print(f"✗ {name:40} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            print(f"✓ {name:40} - корректно вызвано исключение")
+
+    # Длинная дробь: план не хранит степени pin для каждой длины
+    tracemalloc.start()
+    try:
+        convert('0.' + '7' * 10000, 10, 3)
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    if retained < 1 << 20:
+        print(f"✓ {'длинная дробь: память плана':40} = {retained} байт")
+    else:
+        print(f"✗ {'длинная дробь: память плана':40} = {retained} байт (ожидалось < 1 МБ)")
+        all_passed = False
+
+    for name, number in [("convert('1A')", '1A'), ("convert('1.2.3')", '1.2.3'), ("convert('')", '')]:
+        try:
+            plan.convert(number)
+            print(f"✗ {name:40} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            print(f"✓ {name:40} - корректно вызвано исключение")
+
+    return all_passed
+
+
+def cross_test(count: int = 3000):
+    """Сравнение с преобразованием через dval_exact и do"""
+    print("\nСРАВНЕНИЕ С ОБЩИМ ПУТЕМ ПРЕОБРАЗОВАНИЯ")
+    print("=" * 50)
+
+    rnd = random.Random(11)
+    digits = "0123456789ABCDEF"
+    for _ in range(count):
+        pin = rnd.randint(2, 16)
+        pout = rnd.randint(2, 16)
+        number = ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(1, 12)))
+        number += '.' + ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(0, 6)))
+        c = rnd.randint(0, 12)
+
+        expected = Conver_10_P.do(Conver_P_10.dval_exact(number, pin), pout, c)
+        result = ConversionPlan.for_bases(pin, pout).convert(number, c)
+        if result != expected:
+            print(f"✗ ({pin}->{pout}) convert('{number}', {c}) = '{result}' (ожидалось '{expected}')")
+            return False
+
+    # Высокая точность: поиск периода против поразрядного деления
+    for _ in range(count // 10):
+        pin = rnd.randint(2, 16)
+        pout = rnd.randint(2, 16)
+        number = ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(1, 4)))
+        number += '.' + ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(1, 8)))
+        c = rnd.randint(Conver_10_P.PERIOD_THRESHOLD + 1, 400)
+
+        threshold = Conver_10_P.PERIOD_THRESHOLD
+        Conver_10_P.PERIOD_THRESHOLD = 10 ** 9
+        try:
+            expected = Conver_10_P.do(Conver_P_10.dval_exact(number, pin), pout, c)
+        finally:
+            Conver_10_P.PERIOD_THRESHOLD = threshold
+        result = convert(number, pin, pout, c)
+        if result != expected:
+            print(f"✗ ({pin}->{pout}) convert('{number}', {c}) = '{result}' (ожидалось '{expected}')")
+            return False
+
+    print(f"✓ {count + count // 10} случайных чисел совпали")
+    return True
+
+
+def thread_test(count: int = 400):
+    """convert() из пула потоков: те же результаты и полная история"""
+    print("\nПРЕОБРАЗОВАНИЕ ИЗ НЕСКОЛЬКИХ ПОТОКОВ")
+    print("=" * 50)
+
+    rnd = random.Random(18)
+    digits = "0123456789ABCDEF"
+    jobs = []
+    for _ in range(count):
+        pin = rnd.randint(2, 16)
+        pout = rnd.randint(2, 16)
+        number = ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(1, 600)))
+        number += '.' + ''.join(rnd.choice(digits[:pin]) for _ in range(rnd.randint(0, 40)))
+        jobs.append((number, pin, pout, rnd.choice([None, rnd.randint(0, 20)])))
+    expected = [convert(*job) for job in jobs]
+
+    # Кэши степеней заполняются заново из всех потоков сразу
+    Conver_P_10._POWERS.clear()
+    Conver_10_P._POWERS.clear()
+    ConversionPlan._PLANS.clear()
+
+    history = History()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda job: convert(*job, sink=history), jobs))
+
+    passed = results == expected and len(history) == count
+    print(f"{'✓' if passed else '✗'} {count} преобразований в 8 потоках, записей в истории: {len(history)}")
+    return passed
+
+
+def benchmark(number: str = "123456.789", repeat: int = 20000):
+    """Сравнение скорости плана с вызовами dval_exact и do"""
+    plan = ConversionPlan.for_bases(10, 7)
+    c = plan.accuracy(3)
+    t_plan = timeit.timeit(lambda: plan.convert(number, c), number=repeat)
+    t_engine = timeit.timeit(lambda: Conver_10_P.do(Conver_P_10.dval_exact(number, 10), 7, c), number=repeat)
+    print(f"\nПлан: {t_plan:.3f} с, dval_exact + do: {t_engine:.3f} с ({repeat} преобразований)")
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ КЛАССА ConversionPlan")
+    print("=" * 70)
+
+    quick_passed = quick_test()
+    cross_passed = cross_test()
+    thread_passed = thread_test()
+    benchmark()
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+    print(f"Сравнение с общим путем: {'ПРОЙДЕН ✓' if cross_passed else 'НЕ ПРОЙДЕН ✗'}")
+    print(f"Несколько потоков: {'ПРОЙДЕН ✓' if thread_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed and cross_passed and thread_passed else 1)
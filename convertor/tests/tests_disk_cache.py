@@ -0,0 +1,120 @@
+import sys
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from control import Control_
+from disk_cache import DiskCache
+
+
+def fill(path: str, start: int) -> int:
+    """Запись 300 значений из отдельного процесса"""
+    with DiskCache(path, flush_every=64) as cache:
+        for i in range(start, start + 300):
+            cache.put(str(i), 10, 2, 0, format(i, "b"))
+    return start
+
+
+def quick_test(tmp: str):
+    """Быстрый тест постоянного кэша"""
+    print("БЫСТРЫЙ ТЕСТ ПОСТОЯННОГО КЭША")
+    print("=" * 50)
+
+    path = os.path.join(tmp, "cache.db")
+    with DiskCache(path) as cache:
+        miss = cache.get("10.5", 10, 16, 1)
+        cache.put("10.5", 10, 16, 1, "A.8")
+        pending_hit = cache.get("10.5", 10, 16, 1)
+        other_acc = cache.get("10.5", 10, 16, 2)
+
+    with DiskCache(path) as cache:
+        reopened = cache.get("10.5", 10, 16, 1)
+        many = cache.get_many(["10.5", "255", "10.5"], 10, 16, [1, 0, 2])
+        info = cache.info()
+
+    # close() сохраняет записи, даже если из кэша ничего не читали
+    write_only = os.path.join(tmp, "write_only.db")
+    cache = DiskCache(write_only)
+    cache.put("1", 10, 16, 0, "1")
+    cache.close()
+    with DiskCache(write_only) as cache:
+        write_only_hit = cache.get("1", 10, 16, 0)
+
+    # Вытеснение: в файле остается не больше max_size записей
+    small = os.path.join(tmp, "small.db")
+    with DiskCache(small, max_size=50, flush_every=10) as cache:
+        for i in range(200):
+            cache.put(str(i), 10, 2, 0, format(i, "b"))
+        cache.flush()
+        small_size = cache.info()["size"]
+        newest = cache.get("199", 10, 2, 0)
+
+    # Несколько процессов пишут в один файл
+    shared = os.path.join(tmp, "shared.db")
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        list(pool.map(fill, [shared] * 3, [0, 300, 600]))
+    with DiskCache(shared) as cache:
+        numbers = [str(i) for i in range(900)]
+        shared_results = cache.get_many(numbers, 10, 2, [0] * 900)
+
+    # Второй Control_ с тем же файлом получает результат из кэша
+    control_path = os.path.join(tmp, "control.db")
+    with DiskCache(control_path, flush_every=1) as cache:
+        c = Control_(disk_cache=cache)
+        for cmd in (1, 0, 16, 5):
+            c.do_command(cmd)
+        first = c.do_command(Control_.CMD_EXECUTE)
+    with DiskCache(control_path) as cache:
+        c = Control_(disk_cache=cache)
+        for cmd in (1, 0, 16, 5):
+            c.do_command(cmd)
+        second = c.do_command(Control_.CMD_EXECUTE)
+        control_hits = cache.info()["hits"]
+
+    tests = [
+        ("промах в пустом кэше", miss, None),
+        ("попадание до сохранения в файл", pending_hit, "A.8"),
+        ("другая точность - другой ключ", other_acc, None),
+        ("запись сохраняется в файле", reopened, "A.8"),
+        ("get_many", many, ["A.8", None, None]),
+        ("info(): попадания/промахи/размер", (info["hits"], info["misses"], info["size"]), (2, 2, 1)),
+        ("close() без чтения сохраняет записи", write_only_hit, "1"),
+        ("вытеснение до max_size", small_size, 50),
+        ("новая запись не вытеснена", newest, "11000111"),
+        ("3 процесса: все записи", shared_results, [format(i, "b") for i in range(900)]),
+        ("Control_: тот же результат", (first, second), ("A.8", "A.8")),
+        ("Control_: попадание во втором запуске", control_hits, 1),
+    ]
+
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name}")
+        else:
+            print(f"✗ {name} = {result!r} (ожидалось {expected!r})")
+            all_passed = False
+
+    for name, args in [("max_size=0", (path, 0)), ("flush_every=0", (path, 10, 0))]:
+        try:
+            DiskCache(*args)
+            print(f"✗ {name} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            print(f"✓ {name} - корректно вызвано исключение")
+
+    return all_passed
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ КЛАССА DiskCache")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        quick_passed = quick_test(tmp)
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed else 1)
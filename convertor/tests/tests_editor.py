@@ -313,6 +313,17 @@ def quick_test():
         ("Точность числа 10.5", lambda: (e:=Editor()) and (e.add_digit(1,10), e.add_digit(0,10), e.add_delim(), e.add_digit(5,10)) and e.acc(), 1),
         ("Команда do_edit 5", lambda: Editor().do_edit(5, 10), "5"),
         ("Команда do_edit 16 (разделитель)", lambda: Editor().do_edit(16, 10), "0."),
+        ("Значение числа 1A.8 (16-ная)", lambda: (e:=Editor()) and (e.add_digit(1,16), e.add_digit(10,16), e.add_delim(), e.add_digit(8,16)) and e.value(16), (26, 8, 1)),
+        ("Значение после забоя", lambda: (e:=Editor()) and (e.add_digit(1,10), e.add_digit(2,10), e.add_delim(), e.add_digit(5,10), e.bs(), e.bs(), e.bs()) and e.value(10), (1, 0, 0)),
+        ("set_number('007.50', 10)", lambda: Editor().set_number('007.50', 10), "07.50"),
+        ("set_number('.8', 16)", lambda: (e:=Editor()) and e.set_number('.8', 16) and (e.number, e.acc(), e.value(16)), ("0.8", 1, (0, 8, 1))),
+        ("set_number('ff', 16)", lambda: Editor().set_number('ff', 16), "FF"),
+        ("append_many(1 0 . 5 BS 7)", lambda: Editor().append_many([1, 0, 16, 5, 17, 7], 10), "10.7"),
+        ("append_many: цифра вне основания", lambda: Editor().append_many([1, 12, 0, 0], 10), "100"),
+        ("append_many после ввода", lambda: (e:=Editor()) and (e.add_digit(3, 8), e.append_many([0, 0, 16], 8)) and e.number, "300."),
+        ("Значение: 40 цифр, 25 забоев", lambda: (e:=Editor()) and [e.add_digit(d % 7, 7) for d in range(1, 41)] and [e.bs() for _ in range(25)] and e.value(7), (int("".join(str(d % 7) for d in range(1, 16)), 7), 0, 0)),
+        ("acc() дроби из 30 цифр после забоя", lambda: (e:=Editor()) and (e.add_delim(), [e.add_digit(3, 4) for _ in range(31)], e.bs()) and (e.acc(), e.value(4)[1:]), (30, (int("3" * 30, 4), 30))),
+        ("Значение в другом основании", lambda: (e:=Editor()) and (e.add_digit(1,10), e.add_digit(1,10)) and e.value(2), (3, 0, 0)),
     ]
     
     all_passed = True
@@ -328,6 +339,24 @@ def quick_test():
             print(f"✗ {name:30} вызвал исключение: {e}")
             all_passed = False
     
+    # Недопустимый ввод: исключение, число не меняется
+    for name, action in [("set_number('12G', 16)", lambda e: e.set_number('12G', 16)),
+                         ("set_number('1.2.3', 10)", lambda e: e.set_number('1.2.3', 10)),
+                         ("set_number('5', 17)", lambda e: e.set_number('5', 17)),
+                         ("append_many([1, 99], 10)", lambda e: e.append_many([1, 99], 10))]:
+        e = Editor()
+        e.add_digit(7, 10)
+        try:
+            action(e)
+            print(f"✗ {name:30} - исключение не вызвано")
+            all_passed = False
+        except ValueError:
+            if e.number == "7":
+                print(f"✓ {name:30} - корректно вызвано исключение")
+            else:
+                print(f"✗ {name:30} - число изменено: '{e.number}'")
+                all_passed = False
+    
     return all_passed
 
 
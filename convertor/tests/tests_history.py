@@ -1,8 +1,10 @@
 import sys
 import os
+import tempfile
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from history import History, Record
+from history import History, PersistentHistory, Record
+from control import Control_
 
 class StructuralTester:
     """
@@ -293,6 +295,128 @@ def quick_test():
     return True
 
 
+def ring_test():
+    """История ограниченной длины и записи с отложенным форматированием времени"""
+    print("\nИСТОРИЯ ОГРАНИЧЕННОЙ ДЛИНЫ")
+    print("=" * 50)
+    
+    history = History(max_len=3)
+    for i in range(7):
+        history.add_record(10, 2, str(i), format(i, "b"))
+    numbers = [record.number1 for record in history.get_all_records()]
+    indexed = [history[i].number1 for i in range(len(history))]
+    
+    unbounded = History()
+    for i in range(7):
+        unbounded.add_record(10, 2, str(i), format(i, "b"))
+    
+    record = Record(10, 16, "255", "FF", created=0.0)
+    
+    tests = [
+        ("хранятся последние 3 записи", numbers, ["4", "5", "6"]),
+        ("history[i] в порядке добавления", indexed, ["4", "5", "6"]),
+        ("history[-1] и get_last_record()", (history[-1].number1, history.get_last_record().number1), ("6", "6")),
+        ("get_record(-3)", history.get_record(-3).number1, "4"),
+        ("get_record(3) вне диапазона", history.get_record(3), None),
+        ("без max_len хранятся все записи", len(unbounded), 7),
+        ("у Record нет __dict__", hasattr(record, "__dict__"), False),
+        ("время хранится числом", record.time, 0.0),
+        ("форматирование в __str__", str(record).endswith("] 255 (осн.10) -> FF (осн.16)"), True),
+    ]
+    
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name}")
+        else:
+            print(f"✗ {name} = {result!r} (ожидалось {expected!r})")
+            all_passed = False
+    
+    history.clear()
+    history.add_record(2, 10, "1", "1")
+    if history.get_all_records()[0].number1 == "1" and len(history) == 1:
+        print("✓ clear() сбрасывает кольцевой буфер")
+    else:
+        print("✗ clear() сбрасывает кольцевой буфер")
+        all_passed = False
+    
+    try:
+        History(max_len=0)
+        print("✗ max_len=0 - исключение не вызвано")
+        all_passed = False
+    except ValueError:
+        print("✓ max_len=0 - корректно вызвано исключение")
+    
+    return all_passed
+
+
+def persistent_test():
+    """История в файле: сохранение между запусками и чтение по индексу"""
+    print("\nИСТОРИЯ В ФАЙЛЕ")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.jsonl")
+        with PersistentHistory(path) as history:
+            for i in range(100):
+                history.add_record(10, 2, str(i), format(i, "b"))
+            before_close = (history[-1].number1, history.get_record(50).number2)
+        
+        with PersistentHistory(path) as history:
+            reopened = [len(history), history[0].number1, history[-1].number2, history.get_record(100)]
+            history.add_record(16, 10, "Ж", "-")
+            appended = (len(history), history[100].number1)
+            all_numbers = [record.number1 for record in history.get_all_records()]
+        
+        # Второй объект на том же файле не открывается, пока открыт первый
+        with PersistentHistory(path) as history:
+            try:
+                PersistentHistory(path)
+                second_writer = "открыт"
+            except OSError:
+                second_writer = "OSError"
+        with PersistentHistory(path) as history:
+            after_close = len(history)
+        
+        # Прерванная запись в конце индекса отбрасывается при открытии
+        with open(path + ".idx", "ab") as f:
+            f.write(PersistentHistory.INDEX_ENTRY.pack(10 ** 9, 10))
+        with PersistentHistory(path) as history:
+            torn = (len(history), history[-1].number1)
+            history.clear()
+            cleared = (len(history), history.get_record(0), os.path.getsize(path))
+        
+        control_path = os.path.join(tmp, "control.jsonl")
+        with PersistentHistory(control_path) as history:
+            c = Control_(history=history)
+            for cmd in (1, 0, 16, 5, Control_.CMD_EXECUTE):
+                c.do_command(cmd)
+        with PersistentHistory(control_path) as history:
+            control_record = (history[0].number1, history[0].number2)
+    
+    tests = [
+        ("чтение до закрытия", before_close, ("99", "110010")),
+        ("после повторного открытия", reopened, [100, "0", "1100011", None]),
+        ("добавление после открытия", appended, (101, "Ж")),
+        ("get_all_records()", all_numbers, [str(i) for i in range(100)] + ["Ж"]),
+        ("второй объект на том же файле", second_writer, "OSError"),
+        ("открытие после close() первого", after_close, 101),
+        ("прерванная запись отброшена", torn, (101, "Ж")),
+        ("clear() очищает файлы", cleared, (0, None, 0)),
+        ("Control_ с историей в файле", control_record, ("10.5", "A.8")),
+    ]
+    
+    all_passed = True
+    for name, result, expected in tests:
+        if result == expected:
+            print(f"✓ {name}")
+        else:
+            print(f"✗ {name} = {result!r} (ожидалось {expected!r})")
+            all_passed = False
+    
+    return all_passed
+
+
 def demo():
     """Демонстрация работы класса History"""
     print("\n" + "=" * 60)
@@ -343,7 +467,7 @@ if __name__ == "__main__":
     print("=" * 70)
     
     print("\n1. Быстрый тест основных функций:")
-    quick_passed = quick_test()
+    quick_passed = quick_test() and ring_test() and persistent_test()
     
     if quick_passed:
         print("\n✓ Быстрый тест пройден успешно!")
@@ -1,8 +1,12 @@
 import sys
 import os
+import timeit
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from fractions import Fraction
+from itertools import islice
+
 from convers.conver_10_p import Conver_10_P
 class Tests:
     @staticmethod
@@ -286,6 +290,33 @@ def quick_test():
         ("do(-17.875, 16, 3)", Conver_10_P.do(-17.875, 16, 3), '-11.E'),
         ("do(10.5, 2, 4)", Conver_10_P.do(10.5, 2, 4), '1010.1'),
         ("do(0.0, 16, 3)", Conver_10_P.do(0.0, 16, 3), '0'),
+        ("do(-0.5, 2, 4)", Conver_10_P.do(-0.5, 2, 4), '-0.1'),
+        ("do(Fraction(1, 3), 3, 5)", Conver_10_P.do(Fraction(1, 3), 3, 5), '0.1'),
+        ("do(16**200 - 1, 16, 0)", Conver_10_P.do(16 ** 200 - 1, 16, 0), 'F' * 200),
+        ("int_to_p(7**5000, 7)", Conver_10_P.int_to_p(7 ** 5000, 7), '1' + '0' * 5000),
+        ("do_many([10.5, -17.875, 0.0], 16, 3)", Conver_10_P.do_many([10.5, -17.875, 0.0], 16, 3),
+         ['A.8', '-11.E', '0']),
+        ("do_many([10, -1], 2, 0)", Conver_10_P.do_many([10, -1], 2, 0), ['1010', '-1']),
+        ("do_all(255.5, [2, 8, 16], 3)", Conver_10_P.do_all(255.5, [2, 8, 16], 3),
+         {2: '11111111.1', 8: '377.4', 16: 'FF.8'}),
+        ("do_all(-1/3, [3, 9], {3: 3, 9: 2})", Conver_10_P.do_all(Fraction(-1, 3), [3, 9], {3: 3, 9: 2}),
+         {3: '-0.1', 9: '-0.3'}),
+        ("iter_fraction_digits(0.625, 2)", ''.join(Conver_10_P.iter_fraction_digits(0.625, 2)), '101'),
+        ("iter_fraction_digits(1/7, 10)[:6]",
+         ''.join(islice(Conver_10_P.iter_fraction_digits(Fraction(1, 7), 10), 6)), '142857'),
+        ("iter_fraction_digits(1/3, 2)[2000:2004]",
+         ''.join(islice(Conver_10_P.iter_fraction_digits(Fraction(1, 3), 2), 2000, 2004)), '0101'),
+        ("fraction_period(1/10, 3)", Conver_10_P.fraction_period(Fraction(1, 10), 3), ('', '0022')),
+        ("fraction_period(0.625, 2)", Conver_10_P.fraction_period(0.625, 2), ('101', '')),
+        ("fraction_period(1/97, 10, 10)", Conver_10_P.fraction_period(Fraction(1, 97), 10, 10), None),
+        ("do_periodic(-7/6, 10)", Conver_10_P.do_periodic(Fraction(-7, 6), 10), '-1.1(6)'),
+        ("fraction_period(0.1, 3) - float", Conver_10_P.fraction_period(0.1, 3), ('', '0022')),
+        ("do_periodic(0.1, 3) - float", Conver_10_P.do_periodic(0.1, 3), '0.(0022)'),
+        ("flt_to_p(1/7, 3, 100)", Conver_10_P.flt_to_p(Fraction(1, 7), 3, 100),
+         ''.join(islice(Conver_10_P.iter_fraction_digits(Fraction(1, 7), 3), 100))),
+        ("int_to_p(48879, 16)", Conver_10_P.int_to_p(48879, 16), 'BEEF'),
+        ("int_to_p(16**5000 - 1, 16)", Conver_10_P.int_to_p(16 ** 5000 - 1, 16), 'F' * 5000),
+        ("int_to_p(-(10**3000 - 1), 10)", Conver_10_P.int_to_p(-(10 ** 3000 - 1), 10), '-' + '9' * 3000),
     ]
     
     all_passed = True
@@ -298,6 +329,15 @@ def quick_test():
     
     return all_passed
 
+def benchmark(repeat: int = 5000):
+    """Сравнение поразрядного цикла с обработкой групп по k цифр"""
+    # Основание 7: для 2, 8, 10, 16 _int_to_p_simple вызывает встроенный format()
+    n = 10 ** 250  # ~300 цифр в основании 7
+    t_digits = timeit.timeit(lambda: Conver_10_P._int_to_p_digits(n, 7), number=repeat)
+    t_chunks = timeit.timeit(lambda: Conver_10_P._int_to_p_simple(n, 7), number=repeat)
+    print(f"Поразрядно: {t_digits:.3f} с, группами по k цифр: {t_chunks:.3f} с ({repeat} вызовов)")
+
+
 if __name__ == "__main__":
     print("ТЕСТИРОВАНИЕ КЛАССА Conver_10_P")
     print("=" * 70)
@@ -305,6 +345,7 @@ if __name__ == "__main__":
     # быстрый тест
     print("\n1. Быстрый тест основных функций:")
     quick_passed = quick_test()
+    benchmark()
     
     if quick_passed:
         print("\n✓ Быстрый тест пройден успешно!")
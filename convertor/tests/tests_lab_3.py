@@ -1,8 +1,11 @@
 import sys
 import os
+import timeit
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from fractions import Fraction
+
 from convers.conver_p_10 import Conver_P_10
 
 class StructuralTester:
@@ -246,8 +249,38 @@ def quick_test():
         ("dval('0.5', 10)", Conver_P_10.dval('0.5', 10), 0.5),
         ("dval('A5', 16)", Conver_P_10.dval('A5', 16), 165.0),
         ("dval('.E', 16)", Conver_P_10.dval('.E', 16), 0.875),
+        
+        ("dval_exact('A5.E', 16)", Conver_P_10.dval_exact('A5.E', 16), Fraction(1327, 8)),
+        ("dval_exact('-0.1', 3)", Conver_P_10.dval_exact('-0.1', 3), Fraction(-1, 3)),
+        ("dval_exact('F'*200, 16)", Conver_P_10.dval_exact('F' * 200, 16), 16 ** 200 - 1),
+        ("dval_exact('1'*5000, 2)", Conver_P_10.dval_exact('1' * 5000, 2), 2 ** 5000 - 1),
+        ("dval_exact('0.'+'7'*3000, 8)", Conver_P_10.dval_exact('0.' + '7' * 3000, 8),
+         Fraction(8 ** 3000 - 1, 8 ** 3000)),
     ]
     
+    tests.append(("dval_exact('7'*10000, 8)", Conver_P_10.dval_exact('7' * 10000, 8) == 8 ** 10000 - 1, True))
+    
+    # Строки, которые принял бы встроенный int(), но не конвертер
+    for bad, P in [(' 12', 8), ('1_0', 8), ('+5', 8), ('\u0661\u0662', 8), ('19', 8),
+                   ('0x1F', 16), ('0X1F', 16), ('0o17', 8), ('0O17', 8), ('0b101', 2), ('0B101', 2)]:
+        try:
+            Conver_P_10.dval_exact(bad, P)
+            tests.append((f"dval_exact({bad!r}, {P}) - нет исключения", 1, 0))
+        except ValueError:
+            tests.append((f"dval_exact({bad!r}, {P}) - исключение", 0, 0))
+    
+    # 'b' - цифра основания 16: '0b1' - обычное число
+    tests.append(("dval_exact('0b1', 16)", Conver_P_10.dval_exact('0b1', 16), 0xB1))
+    
+    # Без префикса строка разбирается встроенным int()
+    for digits, P in [('7', 8), ('1b', 16), ('3B', 16), ('0', 2)]:
+        tests.append((f"_convert_int_native({digits!r}, {P})",
+                      Conver_P_10._convert_int_native(digits, P), int(digits, P)))
+    
+    batch = Conver_P_10.dval_many(['A5.E', '-A5.E', 'FF', '.E', 'F' * 40], 16)
+    for i, expected in enumerate([165.875, -165.875, 255.0, 0.875, float(16 ** 40 - 1)]):
+        tests.append((f"dval_many(...)[{i}]", batch[i], expected))
+    
     all_passed = True
     for name, result, expected in tests:
         if abs(result - expected) < 1e-10:
@@ -259,6 +292,14 @@ def quick_test():
     return all_passed
 
 
+def benchmark(repeat: int = 5000):
+    """Сравнение поразрядного цикла с обработкой групп по k цифр"""
+    s = '7' * 250
+    t_digits = timeit.timeit(lambda: Conver_P_10._convert_int_digits(s, 10), number=repeat)
+    t_chunks = timeit.timeit(lambda: Conver_P_10._convert_int_simple(s, 10), number=repeat)
+    print(f"Поразрядно: {t_digits:.3f} с, группами по k цифр: {t_chunks:.3f} с ({repeat} вызовов)")
+
+
 # Основная программа
 if __name__ == "__main__":
     print("ТЕСТИРОВАНИЕ КЛАССА Conver_P_10")
@@ -267,6 +308,7 @@ if __name__ == "__main__":
     # Быстрый тест
     print("\n1. Быстрый тест основных функций:")
     quick_passed = quick_test()
+    benchmark()
     
     if quick_passed:
         print("\n✓ Быстрый тест пройден успешно!")
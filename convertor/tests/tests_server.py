@@ -0,0 +1,135 @@
+import sys
+import os
+import asyncio
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import server
+from convers.conversion_plan import ConversionPlan
+
+
+async def exchange(reader, writer, requests):
+    """Отправить все запросы сразу (конвейер) и прочитать ответы"""
+    for request in requests:
+        line = request if isinstance(request, str) else json.dumps(request)
+        writer.write(line.encode("utf-8") + b"\n")
+    await writer.drain()
+    responses = []
+    for _ in range(sum(1 for r in requests if not isinstance(r, str) or r.strip())):
+        responses.append(json.loads(await reader.readline()))
+    return responses
+
+
+async def run_tests():
+    results = []
+    long_number = "F" * 1000 + ".8"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        srv = await server.start_server(port=0, executor=executor, limit=2)
+        port = srv.sockets[0].getsockname()[1]
+        async with srv:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = await exchange(reader, writer, [
+                {"id": 1, "number": "10.5", "pin": 10, "pout": 16},
+                {"id": 2, "number": long_number, "pin": 16, "pout": 10},
+                {"id": 3, "number": "255"},
+                {"id": 4, "number": "0.1", "pin": 10, "pout": 2, "acc": 4},
+                {"id": 5, "number": "1A", "pin": 10, "pout": 16},
+                {"id": 6, "number": "1", "pin": 1, "pout": 16},
+                "не JSON",
+                "",
+                {"id": 7, "number": 5},
+            ])
+            results.append(("ответы в порядке запросов", [r["id"] for r in responses],
+                            [1, 2, 3, 4, 5, 6, None, 7]))
+            results.append(("10.5: 10 -> 16", responses[0].get("result"), "A.8"))
+            results.append(("длинное число в пуле",
+                            responses[1].get("result"), ConversionPlan(16, 10).convert(long_number)))
+            results.append(("основания по умолчанию", responses[2].get("result"), "FF"))
+            results.append(("точность acc=4", responses[3].get("result"), "0.0001"))
+            results.append(("ошибки: поле error",
+                            [("error" in r) for r in responses[4:]], [True] * 4))
+
+            # Конвейер длиннее ограничения очереди
+            many = [{"id": i, "number": str(i), "pin": 10, "pout": 2} for i in range(200)]
+            responses = await exchange(reader, writer, many)
+            results.append(("200 запросов при limit=2",
+                            [r.get("result") for r in responses], [format(i, "b") for i in range(200)]))
+
+            # Разные точности не добавляют планов в кэш
+            ConversionPlan.for_bases(10, 3)
+            plans = len(ConversionPlan._PLANS)
+            responses = await exchange(reader, writer, [
+                {"id": i, "number": "0.1", "pin": 10, "pout": 3, "acc": i} for i in range(100)
+            ] + [{"id": -1, "number": "0.1", "pin": 10, "pout": 3, "acc": -1}])
+            results.append(("100 точностей: планов в кэше не прибавилось",
+                            len(ConversionPlan._PLANS) - plans, 0))
+            results.append(("acc=-1: поле error", "error" in responses[-1], True))
+
+            # Соединения независимы
+            reader2, writer2 = await asyncio.open_connection("127.0.0.1", port)
+            responses = await exchange(reader2, writer2, [{"id": "a", "number": "7", "pin": 8, "pout": 2}])
+            results.append(("второе соединение", responses, [{"id": "a", "result": "111"}]))
+            for w in (writer, writer2):
+                w.close()
+                await w.wait_closed()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "convertor.sock")
+        srv = await server.start_server(path=path)
+        async with srv:
+            reader, writer = await asyncio.open_unix_connection(path)
+            responses = await exchange(reader, writer, [{"number": "-17.875", "pin": 10, "pout": 16}])
+            results.append(("Unix-сокет", responses, [{"id": None, "result": "-11.E"}]))
+
+            # Без пула: слишком большая точность - ошибка только этого запроса
+            responses = await exchange(reader, writer, [
+                {"id": 1, "number": "10.5", "pin": 10, "pout": 16},
+                {"id": 2, "number": "0.1", "pin": 10, "pout": 3, "acc": 10 ** 30},
+                {"id": 3, "number": "0.1", "pin": 10, "pout": 3, "acc": server.MAX_ACC + 1},
+                {"id": 4, "number": "255", "pin": 10, "pout": 16},
+            ])
+            results.append(("acc больше MAX_ACC: ошибка, соединение работает",
+                            [(r["id"], r.get("result"), "error" in r) for r in responses],
+                            [(1, "A.8", False), (2, None, True), (3, None, True), (4, "FF", False)]))
+            writer.close()
+            await writer.wait_closed()
+
+    try:
+        await server.start_server(port=0, limit=0)
+        results.append(("limit=0 - исключение", False, True))
+    except ValueError:
+        results.append(("limit=0 - исключение", True, True))
+
+    return results
+
+
+def quick_test():
+    """Быстрый тест сервера преобразования"""
+    print("БЫСТРЫЙ ТЕСТ СЕРВЕРА ПРЕОБРАЗОВАНИЯ")
+    print("=" * 50)
+
+    all_passed = True
+    for name, result, expected in asyncio.run(run_tests()):
+        if result == expected:
+            print(f"✓ {name}")
+        else:
+            print(f"✗ {name} = {result!r} (ожидалось {expected!r})")
+            all_passed = False
+
+    return all_passed
+
+
+if __name__ == "__main__":
+    print("ТЕСТИРОВАНИЕ МОДУЛЯ server")
+    print("=" * 70)
+
+    quick_passed = quick_test()
+
+    print("\n" + "=" * 70)
+    print(f"Быстрый тест: {'ПРОЙДЕН ✓' if quick_passed else 'НЕ ПРОЙДЕН ✗'}")
+
+    sys.exit(0 if quick_passed else 1)